@@ -2,8 +2,11 @@
 Demonstration of hash table implementations and their usage.
 """
 
+import io
 import sys
 import os
+from contextlib import contextmanager
+import numpy as np
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.hash_tables import (
@@ -13,11 +16,26 @@ from src.hash_tables import (
 )
 from src.hash_functions import (
     division_hash,
+    division_hash_vec,
+    multiplication_hash_vec,
     string_hash_polynomial,
     string_hash_simple
 )
 
 
+@contextmanager
+def _buffered_stdout():
+    """Collect everything printed inside the block and write it to stdout at once."""
+    buf = io.StringIO()
+    old_stdout = sys.stdout
+    sys.stdout = buf
+    try:
+        yield
+    finally:
+        sys.stdout = old_stdout
+        old_stdout.write(buf.getvalue())
+
+
 def demo_direct_address_table():
     """Demonstrate direct-address table."""
     print("=" * 60)
@@ -72,8 +90,9 @@ def demo_open_addressing():
     
     # Test with quadratic probing
     print("\n--- Quadratic Probing ---")
-    # Use larger table size for quadratic probing to avoid probe sequence issues
-    ht_quad = HashTableOpenAddressing(20, probe_type='quadratic')
+    # Like double hashing below, its probe sequence visits every slot of the
+    # power-of-two table, so the same size as for linear probing works
+    ht_quad = HashTableOpenAddressing(10, probe_type='quadratic')
     
     for key in keys:
         ht_quad.insert(key, f"Value_{key}")
@@ -83,8 +102,7 @@ def demo_open_addressing():
     
     # Test with double hashing
     print("\n--- Double Hashing ---")
-    # Use larger table size for double hashing to ensure all keys can be inserted
-    ht_double = HashTableOpenAddressing(20, probe_type='double')
+    ht_double = HashTableOpenAddressing(10, probe_type='double')
     
     for key in keys:
         ht_double.insert(key, f"Value_{key}")
@@ -169,39 +187,38 @@ def demo_collision_comparison():
     print("=" * 60)
     
     # Generate test keys
-    keys = list(range(100, 200))
+    keys = np.arange(100, 200, dtype=np.int64)
     table_size = 50
     
-    from src.hash_functions import (
-        division_hash,
-        multiplication_hash,
-        string_hash_simple,
-        string_hash_polynomial
-    )
-    
+    # Vectorized hash functions hash the whole key array in one NumPy call
     hash_funcs = {
-        'Division': division_hash,
-        'Multiplication': lambda k, s: multiplication_hash(k, s),
+        'Division': division_hash_vec,
+        'Multiplication': multiplication_hash_vec,
     }
     
     print(f"\nTesting with {len(keys)} keys and table size {table_size}\n")
     
     for name, hash_func in hash_funcs.items():
-        hash_values = [hash_func(k, table_size) for k in keys]
-        collisions = len(keys) - len(set(hash_values))
+        hash_values = hash_func(keys, table_size)
+        buckets_used = np.unique(hash_values).size
+        collisions = len(keys) - buckets_used
         collision_rate = collisions / len(keys) * 100
         
         print(f"{name} method:")
         print(f"  Collisions: {collisions}")
         print(f"  Collision rate: {collision_rate:.2f}%")
-        print(f"  Buckets used: {len(set(hash_values))}/{table_size}")
+        print(f"  Buckets used: {buckets_used}/{table_size}")
         print()
 
 
 if __name__ == "__main__":
-    demo_direct_address_table()
-    demo_open_addressing()
-    demo_separate_chaining()
-    demo_hash_functions()
-    demo_collision_comparison()
+    for demo in (
+        demo_direct_address_table,
+        demo_open_addressing,
+        demo_separate_chaining,
+        demo_hash_functions,
+        demo_collision_comparison,
+    ):
+        with _buffered_stdout():
+            demo()
 
@@ -8,12 +8,17 @@ and hash functions for educational and research purposes.
 from .hash_functions import (
     division_hash,
     multiplication_hash,
+    multiplication_hash_int,
     universal_hash,
     string_hash_simple,
     string_hash_polynomial,
     string_hash_djb2,
     md5_hash,
+    fast_string_hash,
     bad_hash_clustering,
+    division_hash_vec,
+    multiplication_hash_vec,
+    bad_hash_clustering_vec,
     get_hash_function
 )
 
@@ -26,12 +31,17 @@ from .hash_tables import (
 __all__ = [
     'division_hash',
     'multiplication_hash',
+    'multiplication_hash_int',
     'universal_hash',
     'string_hash_simple',
     'string_hash_polynomial',
     'string_hash_djb2',
     'md5_hash',
+    'fast_string_hash',
     'bad_hash_clustering',
+    'division_hash_vec',
+    'multiplication_hash_vec',
+    'bad_hash_clustering_vec',
     'get_hash_function',
     'DirectAddressTable',
     'HashTableOpenAddressing',
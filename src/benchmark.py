@@ -2,20 +2,38 @@
 Benchmarking utilities for hash table performance analysis.
 """
 
+import gc
 import time
-import random
-import statistics
-from typing import List, Dict, Any, Callable, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+import numpy as np
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from .hash_tables import HashTableOpenAddressing, HashTableSeparateChaining
 from .hash_functions import (
     division_hash,
     multiplication_hash,
     string_hash_polynomial,
     string_hash_simple,
-    bad_hash_clustering
+    bad_hash_clustering,
+    division_hash_vec,
+    multiplication_hash_vec,
+    bad_hash_clustering_vec
 )
 
 
+@contextmanager
+def _gc_paused():
+    """Disable the cyclic garbage collector for the duration of a timed region."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
 def benchmark_insert(
     hash_table: Any,
     keys: List[int],
@@ -35,36 +53,52 @@ def benchmark_insert(
     if values is None:
         values = keys
     
-    start = time.perf_counter()
-    for key, value in zip(keys, values):
-        hash_table.insert(key, value)
-    end = time.perf_counter()
+    insert_many = hash_table.insert_many
+    perf_counter = time.perf_counter
+    with _gc_paused():
+        start = perf_counter()
+        insert_many(keys, values)
+        end = perf_counter()
     
     return end - start
 
 
 def benchmark_search(
     hash_table: Any,
-    keys: List[int]
+    keys: List[int],
+    min_time: float = 0.0
 ) -> Tuple[float, int]:
     """
     Benchmark search operations.
     
+    Keys are searched one at a time with the table's search method, also for
+    tables that have a batched search_many, so that comparisons between
+    table types time the same kind of lookup. Searching does not modify the
+    table, so small key sets can be searched repeatedly until min_time has
+    elapsed to lift the measurement above timer resolution; the reported
+    time is the average over all passes.
+    
     Args:
         hash_table: Hash table instance
         keys: List of keys to search for
+        min_time: Minimum total time to measure, in seconds (default: one pass)
         
     Returns:
-        Tuple of (time taken in seconds, number of successful searches)
+        Tuple of (time taken in seconds for one pass, number of successful searches)
     """
-    start = time.perf_counter()
-    found = 0
-    for key in keys:
-        if hash_table.search(key) is not None:
-            found += 1
-    end = time.perf_counter()
+    search = hash_table.search
+    perf_counter = time.perf_counter
+    passes = 0
+    with _gc_paused():
+        start = perf_counter()
+        while True:
+            results = [search(key) for key in keys]
+            passes += 1
+            elapsed = perf_counter() - start
+            if elapsed >= min_time:
+                break
     
-    return end - start, found
+    return elapsed / passes, len(results) - results.count(None)
 
 
 def benchmark_delete(
@@ -81,92 +115,150 @@ def benchmark_delete(
     Returns:
         Tuple of (time taken in seconds, number of successful deletions)
     """
-    start = time.perf_counter()
+    delete = hash_table.delete
+    perf_counter = time.perf_counter
     deleted = 0
-    for key in keys:
-        if hash_table.delete(key):
-            deleted += 1
-    end = time.perf_counter()
+    with _gc_paused():
+        start = perf_counter()
+        for key in keys:
+            deleted += delete(key)
+        end = perf_counter()
     
     return end - start, deleted
 
 
-def generate_test_data(n: int, key_range: Tuple[int, int] = None) -> List[int]:
+@lru_cache(maxsize=8)
+def _generate_test_data_cached(n: int, low: int, high: int, seed: int) -> np.ndarray:
+    """Generate (and cache) n seeded random keys in [low, high]."""
+    rng = np.random.default_rng(seed)
+    keys = rng.integers(low, high + 1, size=n, dtype=np.int64)
+    keys.flags.writeable = False  # Shared between callers
+    return keys
+
+
+def generate_test_data(n: int, key_range: Tuple[int, int] = None, seed: int = 42) -> np.ndarray:
     """
     Generate test data for benchmarking.
     
+    Keys are drawn in one call to a seeded NumPy generator (PCG64), so the
+    data is reproducible and comes back as a contiguous int64 array. Results
+    are cached per (n, key_range, seed) and the same read-only array is
+    returned on repeated calls.
+    
     Args:
         n: Number of keys to generate
-        key_range: Optional tuple (min, max) for key range
-        
+        key_range: Optional tuple (min, max) for key range (inclusive)
+        seed: Seed of the generator (benchmark runs pass one each, so their
+            key sets are independent)
+            
     Returns:
-        List of random keys
+        Read-only array of random keys
     """
     if key_range is None:
         key_range = (0, n * 10)
     
-    random.seed(42)  # For reproducibility
-    return [random.randint(key_range[0], key_range[1]) for _ in range(n)]
+    return _generate_test_data_cached(n, key_range[0], key_range[1], seed)
+
+
+# Array versions used by benchmark_hash_functions in place of per-key calls
+_VECTORIZED_HASH_FUNCS = {
+    division_hash: division_hash_vec,
+    multiplication_hash: multiplication_hash_vec,
+    bad_hash_clustering: bad_hash_clustering_vec,
+}
+
+
+def _hash_distribution_stats(
+    counts: Any,
+    elapsed: float
+) -> Dict[str, Any]:
+    """
+    Compute collision and distribution statistics from bucket counts.
+    
+    Args:
+        counts: Number of keys hashed to each bucket (sequence or array of
+            length table_size)
+        elapsed: Time spent hashing the keys into buckets, in seconds
+        
+    Returns:
+        Dictionary of benchmark statistics
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    n = int(counts.sum())
+    bucket_sizes = counts[counts > 0]
+    collision_count = n - len(bucket_sizes)
+    
+    return {
+        'time': elapsed,
+        'collisions': int(collision_count),
+        'collision_rate': collision_count / n if n else 0,
+        'variance': float(bucket_sizes.var()) if len(bucket_sizes) else 0,
+        'buckets_used': int(len(bucket_sizes)),
+        'max_chain_length': int(counts.max()) if n else 0
+    }
 
 
 def benchmark_hash_functions(
     hash_funcs: Dict[str, Callable],
-    keys: List[int],
+    keys: List[Any],
     table_size: int
 ) -> Dict[str, Dict[str, Any]]:
     """
     Benchmark different hash functions.
     
+    Hash functions with an array version (division, multiplication and
+    bad clustering) hash all keys in one vectorized call; any other
+    function is called once per key. Either way each key's hash goes
+    straight into its bucket count, without building a list of hash
+    values; the reported time covers hashing and counting.
+    
     Args:
         hash_funcs: Dictionary mapping function names to hash functions
-        keys: List of keys to hash
+        keys: List of keys to hash (ints, or pre-converted strings for
+            string hash functions)
         table_size: Size of hash table
         
     Returns:
         Dictionary with benchmark results including collision counts
     """
     results = {}
+    keys_arr = None
     
     for name, hash_func in hash_funcs.items():
-        start = time.perf_counter()
-        hash_values = [hash_func(k, table_size) for k in keys]
-        end = time.perf_counter()
-        
-        # Count collisions
-        collision_count = len(keys) - len(set(hash_values))
-        collision_rate = collision_count / len(keys) if keys else 0
-        
-        # Calculate distribution (variance of bucket sizes)
-        bucket_counts = {}
-        for hv in hash_values:
-            bucket_counts[hv] = bucket_counts.get(hv, 0) + 1
-        
-        bucket_sizes = list(bucket_counts.values())
-        if bucket_sizes:
-            avg_bucket_size = sum(bucket_sizes) / len(bucket_sizes)
-            variance = sum((x - avg_bucket_size) ** 2 for x in bucket_sizes) / len(bucket_sizes)
+        vec_func = _VECTORIZED_HASH_FUNCS.get(hash_func)
+        if vec_func is not None:
+            if keys_arr is None:
+                keys_arr = np.asarray(keys, dtype=np.int64)
+            start = time.perf_counter()
+            counts = np.bincount(vec_func(keys_arr, table_size), minlength=table_size)
+            end = time.perf_counter()
         else:
-            variance = 0
+            start = time.perf_counter()
+            counts = [0] * table_size
+            for k in keys:
+                counts[hash_func(k, table_size)] += 1
+            end = time.perf_counter()
         
-        results[name] = {
-            'time': end - start,
-            'collisions': collision_count,
-            'collision_rate': collision_rate,
-            'variance': variance,
-            'buckets_used': len(bucket_counts),
-            'max_chain_length': max(bucket_sizes) if bucket_sizes else 0
-        }
+        results[name] = _hash_distribution_stats(counts, end - start)
     
     return results
 
 
+def _to_columns(columns: Dict[str, List[Any]]) -> Dict[str, np.ndarray]:
+    """Convert per-field result lists into NumPy arrays."""
+    return {field: np.array(values) for field, values in columns.items()}
+
+
 def benchmark_open_addressing_vs_chaining(
     sizes: List[int],
-    probe_types: List[str] = ['linear', 'quadratic', 'double']
-) -> Dict[str, List[Dict[str, Any]]]:
+    probe_types: List[str] = ['linear', 'quadratic', 'double', 'robin_hood']
+) -> Dict[str, Any]:
     """
     Compare open addressing (different probe types) vs separate chaining.
     
+    Results are stored column-wise: every series maps each field name to a
+    NumPy array with one entry per size.
+    
     Args:
         sizes: List of data sizes to test
         probe_types: List of probe types to test
@@ -174,220 +266,259 @@ def benchmark_open_addressing_vs_chaining(
     Returns:
         Dictionary with benchmark results
     """
-    results = {
-        'open_addressing': {pt: [] for pt in probe_types},
-        'separate_chaining': []
-    }
+    oa_fields = ('size', 'insert_time', 'search_time', 'delete_time',
+                 'load_factor', 'found', 'deleted')
+    sc_fields = oa_fields + ('avg_chain_length', 'max_chain_length')
+    oa_results = {pt: {field: [] for field in oa_fields} for pt in probe_types}
+    sc_results = {field: [] for field in sc_fields}
     
     for size in sizes:
-        keys = generate_test_data(size)
+        keys = generate_test_data(size).tolist()
+        # Slice once per size; every table below searches/deletes the same keys
+        search_keys = keys[:size//2]
+        delete_keys = keys[:size//4]
         table_size = int(size * 1.5)  # Start with 1.5x load factor
         
         # Test open addressing with different probe types
         for probe_type in probe_types:
-            ht = HashTableOpenAddressing(table_size, probe_type=probe_type)
+            ht = HashTableOpenAddressing(table_size, probe_type=probe_type, stats=False)
+            ht.reserve(size)  # Keep rehashing out of the timed insert
             
             insert_time = benchmark_insert(ht, keys)
-            search_time, found = benchmark_search(ht, keys[:size//2])
-            delete_time, deleted = benchmark_delete(ht, keys[:size//4])
-            
-            load_factor = ht._load_factor()
+            search_time, found = benchmark_search(ht, search_keys)
+            delete_time, deleted = benchmark_delete(ht, delete_keys)
             
-            results['open_addressing'][probe_type].append({
-                'size': size,
-                'insert_time': insert_time,
-                'search_time': search_time,
-                'delete_time': delete_time,
-                'load_factor': load_factor,
-                'found': found,
-                'deleted': deleted
-            })
+            row = (size, insert_time, search_time, delete_time,
+                   ht._load_factor(), found, deleted)
+            for column, value in zip(oa_results[probe_type].values(), row):
+                column.append(value)
         
         # Test separate chaining
-        ht = HashTableSeparateChaining(table_size)
+        ht = HashTableSeparateChaining(table_size, stats=False)
+        ht.reserve(size)
         
         insert_time = benchmark_insert(ht, keys)
-        search_time, found = benchmark_search(ht, keys[:size//2])
-        delete_time, deleted = benchmark_delete(ht, keys[:size//4])
+        search_time, found = benchmark_search(ht, search_keys)
+        delete_time, deleted = benchmark_delete(ht, delete_keys)
         
         chain_lengths = ht.get_chain_lengths()
         avg_chain_length = sum(chain_lengths) / len(chain_lengths) if chain_lengths else 0
         max_chain_length = max(chain_lengths) if chain_lengths else 0
         
-        results['separate_chaining'].append({
-            'size': size,
-            'insert_time': insert_time,
-            'search_time': search_time,
-            'delete_time': delete_time,
-            'load_factor': ht._load_factor(),
-            'found': found,
-            'deleted': deleted,
-            'avg_chain_length': avg_chain_length,
-            'max_chain_length': max_chain_length
-        })
+        row = (size, insert_time, search_time, delete_time, ht._load_factor(),
+               found, deleted, avg_chain_length, max_chain_length)
+        for column, value in zip(sc_results.values(), row):
+            column.append(value)
     
-    return results
+    return {
+        'open_addressing': {pt: _to_columns(columns) for pt, columns in oa_results.items()},
+        'separate_chaining': _to_columns(sc_results)
+    }
+
+
+# Minimum measured time for the per-batch search timings in benchmark_load_factor_impact
+SEARCH_MIN_TIME = 1e-3
+
+# Number of equal batches the load factor benchmarks insert their keys in
+_LOAD_FACTOR_BATCHES = 10
+
+
+def _sample_std(samples: np.ndarray) -> np.ndarray:
+    """Sample standard deviation across runs (axis 0); zeros for a single run."""
+    if samples.shape[0] > 1:
+        return samples.std(axis=0, ddof=1)
+    return np.zeros(samples.shape[1])
+
+
+def _run_batches(
+    run_func: Callable[[int], Dict[str, List[float]]],
+    num_runs: int,
+    max_workers: Optional[int]
+) -> Dict[str, np.ndarray]:
+    """
+    Execute independent runs and stack their per-batch measurements.
+    
+    Run i is passed the seed 42 + i for its test data, so the runs measure
+    independent key sets (and run 0 the default one of generate_test_data).
+    Runs share no state, so they are spread over worker processes unless
+    max_workers is 1.
+    
+    Args:
+        run_func: Picklable callable performing one run for a given seed,
+            returning a dictionary of per-batch measurement lists
+        num_runs: Number of runs
+        max_workers: Maximum number of worker processes (None: one per CPU)
+        
+    Returns:
+        Dictionary mapping each measurement to a (num_runs, num_batches) array
+    """
+    seeds = range(42, 42 + num_runs)
+    if max_workers == 1 or num_runs == 1:
+        runs = [run_func(seed) for seed in seeds]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            runs = list(pool.map(run_func, seeds))
+    return {field: np.array([run[field] for run in runs]) for field in runs[0]}
+
+
+def _run_load_factor(
+    table_factory: Callable[[], Any],
+    max_elements: int,
+    batch_starts: List[int],
+    batch_size: int,
+    search_sample_size: int,
+    measure: str,
+    reserve: bool,
+    seed: int
+) -> Dict[str, List[float]]:
+    """
+    One run of a load factor benchmark: grow a single table batch by batch.
+    
+    After each batch of inserts, a sample of all keys inserted so far is
+    searched and the table's load factor is recorded. Chain lengths are
+    recorded for separate chaining and probe counts for open addressing.
+    
+    Args:
+        table_factory: Picklable callable returning an empty hash table
+        max_elements: Number of keys to insert over the whole run
+        batch_starts: Start offset of each batch in the key sequence
+        batch_size: Number of keys inserted per batch
+        search_sample_size: Maximum number of inserted keys searched per batch
+        measure: 'time' to time inserts and searches, 'probes' to count
+            probes and key comparisons instead
+        reserve: Pre-size the table for max_elements before inserting
+        seed: Seed of this run's keys
+        
+    Returns:
+        Dictionary of per-batch measurement lists
+    """
+    # Kept as the compact int64 array; only the slices in use become Python ints
+    keys = generate_test_data(max_elements, seed=seed)
+    ht = table_factory()
+    if reserve:
+        ht.reserve(max_elements)
+    has_probes = hasattr(ht, 'get_probe_count')
+    has_chains = hasattr(ht, 'get_chain_lengths')
+    measurements: Dict[str, List[float]] = {}
+    
+    def record(name: str, value: float) -> None:
+        measurements.setdefault(name, []).append(value)
+    
+    for i in batch_starts:
+        batch_keys = keys[i:i+batch_size].tolist()
+        # Search a sample of ALL keys inserted so far
+        search_keys = keys[:min(search_sample_size, i + batch_size)].tolist()
+        
+        if measure == 'time':
+            # Insert and search times are normalized per element
+            record('insert_time', benchmark_insert(ht, batch_keys) / len(batch_keys))
+            search_time, _ = benchmark_search(ht, search_keys, min_time=SEARCH_MIN_TIME)
+            record('search_time', search_time / len(search_keys))
+        else:
+            ht.reset_counts()
+            ht.insert_many(batch_keys)
+            if has_probes:
+                record('insert_probes', ht.get_probe_count())
+            record('insert_comparisons', ht.get_comparison_count())
+            
+            ht.reset_counts()
+            ht.search_many(search_keys)
+            if has_probes:
+                record('search_probes', ht.get_probe_count())
+            record('search_comparisons', ht.get_comparison_count())
+        
+        if has_chains:
+            # Average chain length over non-empty buckets only
+            non_empty_lengths = [l for l in ht.get_chain_lengths() if l > 0]
+            record('avg_chain_length',
+                   sum(non_empty_lengths) / len(non_empty_lengths) if non_empty_lengths else 0)
+        
+        record('load_factor', ht._load_factor())
+    
+    return measurements
+
+
+def _load_factor_runs(
+    initial_size: int,
+    max_elements: int,
+    probe_type: str,
+    num_runs: int,
+    max_workers: Optional[int],
+    reserve: bool,
+    search_sample_size: int,
+    measure: str
+) -> Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Execute the runs of a load factor benchmark for both table types.
+    
+    Returns:
+        Tuple of (elements after each batch, open addressing runs, separate
+        chaining runs); each runs dictionary maps a measurement to a
+        (num_runs, num_batches) array
+    """
+    batch_size = max_elements // _LOAD_FACTOR_BATCHES
+    batch_starts = [i for i in range(0, max_elements, batch_size) if i + batch_size <= max_elements]
+    elements = np.array([i + batch_size for i in batch_starts])
+    
+    # Timed runs skip the probe and comparison counters
+    stats = measure != 'time'
+    runs = []
+    for table_factory in (partial(HashTableOpenAddressing, initial_size, probe_type=probe_type, stats=stats),
+                          partial(HashTableSeparateChaining, initial_size, stats=stats)):
+        run_func = partial(_run_load_factor, table_factory, max_elements, batch_starts,
+                           batch_size, search_sample_size, measure, reserve)
+        runs.append(_run_batches(run_func, num_runs, max_workers))
+    
+    return elements, runs[0], runs[1]
 
 
 def benchmark_load_factor_impact(
     initial_size: int,
     max_elements: int,
     probe_type: str = 'linear',
-    num_runs: int = 5
-) -> Dict[str, List[Dict[str, Any]]]:
+    num_runs: int = 5,
+    max_workers: Optional[int] = 1,
+    reserve: bool = False
+) -> Dict[str, Dict[str, np.ndarray]]:
     """
     Benchmark performance at different load factors with multiple runs for statistical accuracy.
     
+    Each run grows a single table batch by batch, timing every batch as it is
+    inserted, so the total work per run is linear in max_elements. Each run
+    draws its own keys from its own seed. Runs are executed serially by
+    default: runs timed side by side in worker processes compete for cores,
+    caches and memory bandwidth, which skews the timings. Results are
+    stored column-wise, one array entry per batch.
+    
     Args:
         initial_size: Initial hash table size
         max_elements: Maximum number of elements to insert
         probe_type: Probe type for open addressing
         num_runs: Number of runs per load factor for averaging
-        
+        max_workers: Maximum number of worker processes (default 1: run
+            serially in this process; None: one per CPU)
+        reserve: Pre-size each table for max_elements before inserting, so no
+            rehash happens mid-run (default: let the tables grow, including
+            the cost of rehashing)
+            
     Returns:
         Dictionary with results for open addressing and separate chaining
     """
-    results = {
-        'open_addressing': [],
-        'separate_chaining': []
-    }
+    elements, oa_runs, sc_runs = _load_factor_runs(
+        initial_size, max_elements, probe_type, num_runs, max_workers, reserve,
+        search_sample_size=100, measure='time')
     
-    num_samples = 10
-    batch_size = max_elements // num_samples
-    
-    # Test open addressing
-    for i in range(0, max_elements, batch_size):
-        if i + batch_size > max_elements:
-            continue
-        
-        # Run multiple times to get statistical averages
-        insert_times = []
-        search_times = []
-        load_factors = []
-        
-        for run in range(num_runs):
-            keys = generate_test_data(max_elements)
-            ht_oa = HashTableOpenAddressing(initial_size, probe_type=probe_type)
-            inserted_keys_oa = []
-            
-            # Insert up to (but not including) current batch
-            for j in range(0, i, batch_size):
-                batch_keys = keys[j:j+batch_size]
-                if not batch_keys:
-                    continue
-                for key in batch_keys:
-                    ht_oa.insert(key, key)
-                inserted_keys_oa.extend(batch_keys)
-            
-            # Measure insert time for this batch (normalized per element)
-            batch_keys = keys[i:i+batch_size]
-            if batch_keys:
-                batch_start = time.perf_counter()
-                for key in batch_keys:
-                    ht_oa.insert(key, key)
-                batch_end = time.perf_counter()
-                insert_time_per_element = (batch_end - batch_start) / len(batch_keys)
-                insert_times.append(insert_time_per_element)
-                inserted_keys_oa.extend(batch_keys)
-            
-            # Benchmark search on a sample of ALL inserted keys
-            search_sample_size = min(100, len(inserted_keys_oa))
-            search_keys = inserted_keys_oa[:search_sample_size] if inserted_keys_oa else []
-            if search_keys:
-                search_time, _ = benchmark_search(ht_oa, search_keys)
-                search_time_per_element = search_time / len(search_keys)
-                search_times.append(search_time_per_element)
-            
-            load_factors.append(ht_oa._load_factor())
-        
-        # Compute statistics
-        if insert_times and search_times:
-            import statistics
-            avg_insert = statistics.mean(insert_times)
-            std_insert = statistics.stdev(insert_times) if len(insert_times) > 1 else 0
-            avg_search = statistics.mean(search_times)
-            std_search = statistics.stdev(search_times) if len(search_times) > 1 else 0
-            avg_load_factor = statistics.mean(load_factors)
-            
-            results['open_addressing'].append({
-                'elements': i + batch_size,
-                'load_factor': avg_load_factor,
-                'insert_time': avg_insert,
-                'insert_time_std': std_insert,
-                'search_time': avg_search,
-                'search_time_std': std_search
-            })
-    
-    # Test separate chaining
-    for i in range(0, max_elements, batch_size):
-        if i + batch_size > max_elements:
-            continue
-        
-        # Run multiple times to get statistical averages
-        insert_times = []
-        search_times = []
-        load_factors = []
-        chain_lengths_list = []
-        
-        for run in range(num_runs):
-            keys = generate_test_data(max_elements)
-            ht_sc = HashTableSeparateChaining(initial_size)
-            inserted_keys_sc = []
-            
-            # Insert up to (but not including) current batch
-            for j in range(0, i, batch_size):
-                batch_keys = keys[j:j+batch_size]
-                if not batch_keys:
-                    continue
-                for key in batch_keys:
-                    ht_sc.insert(key, key)
-                inserted_keys_sc.extend(batch_keys)
-            
-            # Measure insert time for this batch (normalized per element)
-            batch_keys = keys[i:i+batch_size]
-            if batch_keys:
-                batch_start = time.perf_counter()
-                for key in batch_keys:
-                    ht_sc.insert(key, key)
-                batch_end = time.perf_counter()
-                insert_time_per_element = (batch_end - batch_start) / len(batch_keys)
-                insert_times.append(insert_time_per_element)
-                inserted_keys_sc.extend(batch_keys)
-            
-            # Benchmark search on a sample of ALL inserted keys
-            search_sample_size = min(100, len(inserted_keys_sc))
-            search_keys = inserted_keys_sc[:search_sample_size] if inserted_keys_sc else []
-            if search_keys:
-                search_time, _ = benchmark_search(ht_sc, search_keys)
-                search_time_per_element = search_time / len(search_keys)
-                search_times.append(search_time_per_element)
-            
-            chain_lengths = ht_sc.get_chain_lengths()
-            # Calculate average chain length only for non-empty buckets
-            non_empty_lengths = [l for l in chain_lengths if l > 0]
-            avg_chain_length = sum(non_empty_lengths) / len(non_empty_lengths) if non_empty_lengths else 0
-            chain_lengths_list.append(avg_chain_length)
-            
-            load_factors.append(ht_sc._load_factor())
-        
-        # Compute statistics
-        if insert_times and search_times:
-            avg_insert = statistics.mean(insert_times)
-            std_insert = statistics.stdev(insert_times) if len(insert_times) > 1 else 0
-            avg_search = statistics.mean(search_times)
-            std_search = statistics.stdev(search_times) if len(search_times) > 1 else 0
-            avg_load_factor = statistics.mean(load_factors)
-            avg_chain_length = statistics.mean(chain_lengths_list)
-            
-            results['separate_chaining'].append({
-                'elements': i + batch_size,
-                'load_factor': avg_load_factor,
-                'insert_time': avg_insert,
-                'insert_time_std': std_insert,
-                'search_time': avg_search,
-                'search_time_std': std_search,
-                'avg_chain_length': avg_chain_length
-            })
+    results = {}
+    for name, runs in (('open_addressing', oa_runs), ('separate_chaining', sc_runs)):
+        results[name] = {
+            'elements': elements,
+            'load_factor': runs['load_factor'].mean(axis=0),
+            'insert_time': runs['insert_time'].mean(axis=0),
+            'insert_time_std': _sample_std(runs['insert_time']),
+            'search_time': runs['search_time'].mean(axis=0),
+            'search_time_std': _sample_std(runs['search_time'])
+        }
+    results['separate_chaining']['avg_chain_length'] = sc_runs['avg_chain_length'].mean(axis=0)
     
     return results
 
@@ -396,175 +527,51 @@ def benchmark_load_factor_impact_probes(
     initial_size: int,
     max_elements: int,
     probe_type: str = 'linear',
-    num_runs: int = 10
-) -> Dict[str, List[Dict[str, Any]]]:
+    num_runs: int = 10,
+    max_workers: Optional[int] = None,
+    reserve: bool = False
+) -> Dict[str, Dict[str, np.ndarray]]:
     """
     Benchmark probe counts and comparisons at different load factors.
     Uses deterministic metrics instead of timing for smooth theoretical curves.
     
+    Each run grows a single table batch by batch, measuring every batch as it
+    is inserted, so the total work per run is linear in max_elements. Each run
+    draws its own keys from its own seed, so the runs are independent and,
+    since probe counts do not depend on timing, execute in parallel worker
+    processes. Results are stored column-wise, one array entry per batch.
+    
     Args:
         initial_size: Initial hash table size
         max_elements: Maximum number of elements to insert
         probe_type: Probe type for open addressing
         num_runs: Number of runs per load factor for averaging
-        
+        max_workers: Maximum number of worker processes (None: one per CPU,
+            1: run serially in this process)
+        reserve: Pre-size each table for max_elements before inserting, so no
+            rehash happens mid-run (default: let the tables grow, including
+            the cost of rehashing)
+            
     Returns:
         Dictionary with results for open addressing and separate chaining
     """
-    results = {
-        'open_addressing': [],
-        'separate_chaining': []
-    }
+    search_sample_size = 100  # Fixed sample size for normalization
+    batch_size = max_elements // _LOAD_FACTOR_BATCHES
+    elements, oa_runs, sc_runs = _load_factor_runs(
+        initial_size, max_elements, probe_type, num_runs, max_workers, reserve,
+        search_sample_size=search_sample_size, measure='probes')
     
-    num_samples = 10
-    batch_size = max_elements // num_samples
-    
-    # Test open addressing
-    for i in range(0, max_elements, batch_size):
-        if i + batch_size > max_elements:
-            continue
-        
-        # Run multiple times to get statistical averages
-        insert_probes = []
-        search_probes = []
-        insert_comparisons = []
-        search_comparisons = []
-        load_factors = []
-        search_sample_size = 100  # Fixed sample size for normalization
-        
-        for run in range(num_runs):
-            keys = generate_test_data(max_elements)
-            ht_oa = HashTableOpenAddressing(initial_size, probe_type=probe_type)
-            inserted_keys_oa = []
-            
-            # Insert up to (but not including) current batch
-            for j in range(0, i, batch_size):
-                batch_keys = keys[j:j+batch_size]
-                if not batch_keys:
-                    continue
-                for key in batch_keys:
-                    ht_oa.insert(key, key)
-                inserted_keys_oa.extend(batch_keys)
-            
-            # Reset counters before measuring current batch
-            ht_oa.reset_counts()
-            
-            # Measure insert probes/comparisons for this batch
-            batch_keys = keys[i:i+batch_size]
-            if batch_keys:
-                for key in batch_keys:
-                    ht_oa.insert(key, key)
-                inserted_keys_oa.extend(batch_keys)
-                
-                insert_probes.append(ht_oa.get_probe_count())
-                insert_comparisons.append(ht_oa.get_comparison_count())
-            
-            # Reset counters for search
-            ht_oa.reset_counts()
-            
-            # Benchmark search on a sample of ALL inserted keys
-            actual_search_size = min(search_sample_size, len(inserted_keys_oa))
-            search_keys = inserted_keys_oa[:actual_search_size] if inserted_keys_oa else []
-            if search_keys:
-                for key in search_keys:
-                    ht_oa.search(key)
-                
-                search_probes.append(ht_oa.get_probe_count())
-                search_comparisons.append(ht_oa.get_comparison_count())
-            
-            load_factors.append(ht_oa._load_factor())
-        
-        # Compute statistics
-        if insert_probes and search_probes:
-            # Normalize by batch size and search sample size (fixed at 100)
-            avg_insert_probes = statistics.mean(insert_probes) / batch_size if insert_probes and batch_size > 0 else 0
-            avg_search_probes = statistics.mean(search_probes) / search_sample_size if search_probes and search_sample_size > 0 else 0
-            avg_insert_comparisons = statistics.mean(insert_comparisons) / batch_size if insert_comparisons and batch_size > 0 else 0
-            avg_search_comparisons = statistics.mean(search_comparisons) / search_sample_size if search_comparisons and search_sample_size > 0 else 0
-            avg_load_factor = statistics.mean(load_factors)
-            
-            results['open_addressing'].append({
-                'elements': i + batch_size,
-                'load_factor': avg_load_factor,
-                'insert_probes_per_element': avg_insert_probes,
-                'search_probes_per_element': avg_search_probes,
-                'insert_comparisons_per_element': avg_insert_comparisons,
-                'search_comparisons_per_element': avg_search_comparisons
-            })
-    
-    # Test separate chaining
-    for i in range(0, max_elements, batch_size):
-        if i + batch_size > max_elements:
-            continue
-        
-        # Run multiple times to get statistical averages
-        insert_comparisons = []
-        search_comparisons = []
-        load_factors = []
-        chain_lengths_list = []
-        search_sample_size = 100  # Fixed sample size for normalization
-        
-        for run in range(num_runs):
-            keys = generate_test_data(max_elements)
-            ht_sc = HashTableSeparateChaining(initial_size)
-            inserted_keys_sc = []
-            
-            # Insert up to (but not including) current batch
-            for j in range(0, i, batch_size):
-                batch_keys = keys[j:j+batch_size]
-                if not batch_keys:
-                    continue
-                for key in batch_keys:
-                    ht_sc.insert(key, key)
-                inserted_keys_sc.extend(batch_keys)
-            
-            # Reset counters before measuring current batch
-            ht_sc.reset_counts()
-            
-            # Measure insert comparisons for this batch
-            batch_keys = keys[i:i+batch_size]
-            if batch_keys:
-                for key in batch_keys:
-                    ht_sc.insert(key, key)
-                inserted_keys_sc.extend(batch_keys)
-                
-                insert_comparisons.append(ht_sc.get_comparison_count())
-            
-            # Reset counters for search
-            ht_sc.reset_counts()
-            
-            # Benchmark search on a sample of ALL inserted keys
-            actual_search_size = min(search_sample_size, len(inserted_keys_sc))
-            search_keys = inserted_keys_sc[:actual_search_size] if inserted_keys_sc else []
-            if search_keys:
-                for key in search_keys:
-                    ht_sc.search(key)
-                
-                search_comparisons.append(ht_sc.get_comparison_count())
-            
-            chain_lengths = ht_sc.get_chain_lengths()
-            # Calculate average chain length only for non-empty buckets
-            non_empty_lengths = [l for l in chain_lengths if l > 0]
-            avg_chain_length = sum(non_empty_lengths) / len(non_empty_lengths) if non_empty_lengths else 0
-            chain_lengths_list.append(avg_chain_length)
-            
-            load_factors.append(ht_sc._load_factor())
-        
-        # Compute statistics
-        if insert_comparisons and search_comparisons:
-            # Normalize by batch size and search sample size (fixed at 100)
-            avg_insert_comparisons = statistics.mean(insert_comparisons) / batch_size if insert_comparisons and batch_size > 0 else 0
-            avg_search_comparisons = statistics.mean(search_comparisons) / search_sample_size if search_comparisons and search_sample_size > 0 else 0
-            avg_load_factor = statistics.mean(load_factors)
-            avg_chain_length = statistics.mean(chain_lengths_list)
-            
-            results['separate_chaining'].append({
-                'elements': i + batch_size,
-                'load_factor': avg_load_factor,
-                'insert_comparisons_per_element': avg_insert_comparisons,
-                'search_comparisons_per_element': avg_search_comparisons,
-                'avg_chain_length': avg_chain_length
-            })
+    # Compute statistics, normalized by batch size and search sample size (fixed at 100)
+    results = {}
+    for name, runs in (('open_addressing', oa_runs), ('separate_chaining', sc_runs)):
+        results[name] = {
+            'elements': elements,
+            'load_factor': runs['load_factor'].mean(axis=0),
+            'insert_comparisons_per_element': runs['insert_comparisons'].mean(axis=0) / batch_size,
+            'search_comparisons_per_element': runs['search_comparisons'].mean(axis=0) / search_sample_size
+        }
+    results['open_addressing']['insert_probes_per_element'] = oa_runs['insert_probes'].mean(axis=0) / batch_size
+    results['open_addressing']['search_probes_per_element'] = oa_runs['search_probes'].mean(axis=0) / search_sample_size
+    results['separate_chaining']['avg_chain_length'] = sc_runs['avg_chain_length'].mean(axis=0)
     
     return results
-
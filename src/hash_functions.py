@@ -6,7 +6,12 @@ to demonstrate the impact of hash function design on hash table performance.
 """
 
 import hashlib
-from typing import Any, Callable, Optional
+import zlib
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
 
 
 def division_hash(key: int, table_size: int) -> int:
@@ -42,6 +47,25 @@ def multiplication_hash(key: int, table_size: int, A: float = 0.6180339887) -> i
     return int(table_size * ((key * A) % 1))
 
 
+def multiplication_hash_int(key: int, table_size: int) -> int:
+    """
+    Integer-only multiplication method for the golden-ratio constant (Knuth).
+    
+    Specialization of multiplication_hash for A = (sqrt(5)-1)/2, using
+    32-bit fixed point: A is scaled to 2654435769 = floor(A * 2^32), the
+    fractional part of k*A is the low 32 bits of the product, and scaling
+    by m is a multiply and a shift. No floating-point operations.
+    
+    Args:
+        key: The key to hash
+        table_size: Size of the hash table
+        
+    Returns:
+        Hash value in range [0, table_size-1]
+    """
+    return ((key * 2654435769) & 0xFFFFFFFF) * table_size >> 32
+
+
 def universal_hash(key: int, table_size: int, a: int, b: int, p: int) -> int:
     """
     Universal hash function: h(k) = ((a*k + b) mod p) mod m
@@ -62,6 +86,17 @@ def universal_hash(key: int, table_size: int, a: int, b: int, p: int) -> int:
     return ((a * key + b) % p) % table_size
 
 
+def _char_codes(key: str) -> Iterable[int]:
+    """
+    Character codes of a string key, as fed to the string hash loops.
+    
+    ASCII keys are encoded to bytes, whose iteration yields the codes
+    directly instead of costing an ord() call per character; other keys
+    fall back to ord() via map.
+    """
+    return key.encode('ascii') if key.isascii() else map(ord, key)
+
+
 def string_hash_simple(key: str, table_size: int) -> int:
     """
     Simple string hash function (BAD EXAMPLE - prone to collisions).
@@ -76,10 +111,7 @@ def string_hash_simple(key: str, table_size: int) -> int:
     Returns:
         Hash value in range [0, table_size-1]
     """
-    hash_value = 0
-    for char in key:
-        hash_value += ord(char)
-    return hash_value % table_size
+    return sum(_char_codes(key)) % table_size
 
 
 def string_hash_polynomial(key: str, table_size: int, base: int = 31) -> int:
@@ -99,17 +131,27 @@ def string_hash_polynomial(key: str, table_size: int, base: int = 31) -> int:
         Hash value in range [0, table_size-1]
     """
     hash_value = 0
-    for char in key:
-        hash_value = (hash_value * base + ord(char)) % table_size
+    for code in _char_codes(key):
+        hash_value = (hash_value * base + code) % table_size
     return hash_value
 
 
+# Keys at least this long are hashed 4 characters per step by string_hash_djb2;
+# below it the per-step overhead of unpacking blocks outweighs the savings.
+_DJB2_BLOCK_MIN_LENGTH = 32
+
+
 def string_hash_djb2(key: str, table_size: int) -> int:
     """
     DJB2 hash function - a popular string hash function.
     
     Known for good distribution properties.
     
+    Long keys mix in 4 characters per step by unrolling h = 33*h + c:
+    h' = 33^4*h + 33^3*c0 + 33^2*c1 + 33*c2 + c3. Reducing modulo table_size
+    after each block keeps the intermediate values small and does not change
+    the result.
+    
     Args:
         key: String key to hash
         table_size: Size of the hash table
@@ -118,8 +160,16 @@ def string_hash_djb2(key: str, table_size: int) -> int:
         Hash value in range [0, table_size-1]
     """
     hash_value = 5381
-    for char in key:
-        hash_value = ((hash_value << 5) + hash_value) + ord(char)
+    codes = iter(_char_codes(key))
+    
+    if len(key) >= _DJB2_BLOCK_MIN_LENGTH:
+        block_codes = islice(codes, len(key) - len(key) % 4)
+        for c0, c1, c2, c3 in zip(block_codes, block_codes, block_codes, block_codes):
+            hash_value = (hash_value * 1185921 + c0 * 35937 + c1 * 1089 + c2 * 33 + c3) % table_size
+    
+    # Remaining characters (all of them for short keys)
+    for code in codes:
+        hash_value = hash_value * 33 + code  # (hash << 5) + hash + c
     return hash_value % table_size
 
 
@@ -137,9 +187,26 @@ def md5_hash(key: str, table_size: int) -> int:
     Returns:
         Hash value in range [0, table_size-1]
     """
-    md5_hash_obj = hashlib.md5(key.encode('utf-8'))
-    hash_int = int(md5_hash_obj.hexdigest(), 16)
-    return hash_int % table_size
+    digest = hashlib.md5(key.encode('utf-8')).digest()
+    return int.from_bytes(digest, 'big') % table_size
+
+
+def fast_string_hash(key: str, table_size: int) -> int:
+    """
+    Fast non-cryptographic string hash based on CRC-32.
+    
+    Contrast with md5_hash: CRC-32 runs in C and returns an integer directly,
+    so there is no digest-to-hex-to-int round trip. Good distribution for
+    table indexing without paying for cryptographic strength.
+    
+    Args:
+        key: String key to hash
+        table_size: Size of the hash table
+        
+    Returns:
+        Hash value in range [0, table_size-1]
+    """
+    return zlib.crc32(key.encode('utf-8')) % table_size
 
 
 def bad_hash_clustering(key: int, table_size: int) -> int:
@@ -160,10 +227,63 @@ def bad_hash_clustering(key: int, table_size: int) -> int:
     return (key * table_size) % table_size
 
 
+def division_hash_vec(keys: np.ndarray, table_size: int) -> np.ndarray:
+    """
+    Vectorized division method: hashes a whole array of keys at once.
+    
+    Equivalent to division_hash applied to each key, but runs as a single
+    NumPy operation instead of one Python call per key.
+    
+    Args:
+        keys: Integer keys to hash (converted to an int64 array)
+        table_size: Size of the hash table
+        
+    Returns:
+        Array of hash values in range [0, table_size-1]
+    """
+    return np.asarray(keys, dtype=np.int64) % table_size
+
+
+def multiplication_hash_vec(keys: np.ndarray, table_size: int, A: float = 0.6180339887) -> np.ndarray:
+    """
+    Vectorized multiplication method: hashes a whole array of keys at once.
+    
+    Equivalent to multiplication_hash applied to each key.
+    
+    Args:
+        keys: Integer keys to hash (converted to an int64 array)
+        table_size: Size of the hash table
+        A: Multiplier constant (default: (sqrt(5)-1)/2)
+        
+    Returns:
+        Array of hash values in range [0, table_size-1]
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    return np.floor(table_size * np.mod(keys * A, 1.0)).astype(np.int64)
+
+
+def bad_hash_clustering_vec(keys: np.ndarray, table_size: int) -> np.ndarray:
+    """
+    Vectorized version of bad_hash_clustering (BAD EXAMPLE).
+    
+    Args:
+        keys: Integer keys to hash (converted to an int64 array)
+        table_size: Size of the hash table
+        
+    Returns:
+        Array of hash values (poorly distributed)
+    """
+    return (np.asarray(keys, dtype=np.int64) * table_size) % table_size
+
+
+@lru_cache(maxsize=None)
 def get_hash_function(hash_type: str) -> Callable:
     """
     Get a hash function by name.
     
+    Lookups are cached, so repeated calls with the same name return the
+    same callable without rebuilding the name table.
+    
     Args:
         hash_type: Type of hash function ('division', 'multiplication', 'universal', etc.)
         
@@ -173,10 +293,12 @@ def get_hash_function(hash_type: str) -> Callable:
     hash_functions = {
         'division': division_hash,
         'multiplication': multiplication_hash,
+        'multiplication_int': multiplication_hash_int,
         'string_simple': string_hash_simple,
         'string_polynomial': string_hash_polynomial,
         'string_djb2': string_hash_djb2,
         'md5': md5_hash,
+        'fast': fast_string_hash,
         'bad_clustering': bad_hash_clustering,
     }
     return hash_functions.get(hash_type, division_hash)
@@ -0,0 +1,257 @@
+"""
+Hash Table Kernels Module
+
+This module implements the probe loops of the open-addressing hash table as
+module-level functions over the raw int64 key array, so the table's methods
+only deal with values and bookkeeping. Each kernel takes the key and tag
+arrays, the key, its home slot (from the table's hash function) and whether
+deleted slots end the probe, and returns the number of probes made together
+with the slot where probing stopped.
+
+The tag array is the slot state: one byte per slot holding 7 bits of the key
+taken above the home-slot bits for an occupied slot, or EMPTY_TAG/DELETED_TAG
+(the only values with the high bit set). Keys of free slots are never read,
+so every int64 value is a valid key. Probes test the tag first and compare
+full keys only at occupied slots whose tag matches; a probe that stops at an
+occupied slot has therefore found the key.
+
+The arrays may be passed as NumPy arrays or as memoryviews of them. The
+table passes memoryviews: the first probes read single slots, and indexing
+a memoryview returns a Python int about twice as fast as ndarray.item().
+Vectorized chunks wrap the same buffers in NumPy arrays without copying.
+
+The key array length m must be a power of two: slots are reduced with the
+bitmask m - 1 instead of a modulo.
+"""
+
+from typing import Callable, Optional, Tuple
+import numpy as np
+
+
+EMPTY_TAG = 0x80  # Tag of never-used slots
+DELETED_TAG = 0xFF  # Tag of deleted slots
+
+# _STOP_TAGS[stop_at_deleted, tag][t] is True for slot tags t where a probe
+# for a key with the given tag must look at the slot: a matching tag or a free
+# slot. One table lookup per chunk replaces separate tag and state compares.
+_STOP_TAGS = np.zeros((2, 0x80, 0x100), dtype=np.bool_)
+_STOP_TAGS[:, np.arange(0x80), np.arange(0x80)] = True
+_STOP_TAGS[:, :, EMPTY_TAG] = True
+_STOP_TAGS[1, :, DELETED_TAG] = True
+# The same table as bytes, whose items index faster from Python
+_STOP_TAG_BYTES = [[bytes(row) for row in table] for table in _STOP_TAGS.view(np.uint8)]
+
+# A vectorized step fetches a whole chunk of upcoming probe slots in one
+# gather but costs a few microseconds to set up, so it only pays once a probe
+# has outlasted the cheap single-slot reads.
+SCALAR_PROBES = 16  # Probes checked one slot at a time before switching to vectorized steps
+PROBE_CHUNK = 32  # Slots compared in the first vectorized step; doubles on each further step
+
+
+def key_tag(key: int, mask: int) -> int:
+    """
+    Tag byte of key in a table with the given slot mask.
+    
+    Args:
+        key: Key to tag
+        mask: Slot mask of the table (size - 1)
+        
+    Returns:
+        The 7 key bits above the home-slot bits, in range [0, 0x7F]
+    """
+    return (key >> mask.bit_length()) & 0x7F
+
+
+def _scan_chunks(
+    keys: np.ndarray,
+    tags: np.ndarray,
+    key: int,
+    start: int,
+    slots_for: Callable[[np.ndarray], np.ndarray],
+    stop_tags: np.ndarray
+) -> Tuple[int, int]:
+    """
+    Compare the probe sequence against key a chunk of probe numbers at a time.
+    
+    Each chunk is filtered on the tag array; only slots that are free or
+    whose tag matches are checked against the key array.
+    
+    Args:
+        keys: Key array of the table
+        tags: Tag array of the table
+        key: Key to look for
+        start: First probe number to examine
+        slots_for: Function mapping an array of probe numbers to slot indices
+        stop_tags: Row of _STOP_TAGS for the key's tag
+        
+    Returns:
+        Tuple of (number of probes made, slot index); the slot index is -1
+        if no stopping slot was reached within len(keys) probes
+    """
+    size = len(keys)
+    tags = np.asarray(tags)
+    chunk = PROBE_CHUNK
+    while start < size:
+        stop = min(start + chunk, size)
+        slots = slots_for(np.arange(start, stop, dtype=np.int64))
+        window = tags[slots]
+        for first in stop_tags[window].nonzero()[0].tolist():
+            index = int(slots[first])
+            if window.item(first) >= EMPTY_TAG or keys[index] == key:
+                return start + first + 1, index
+        start = stop
+        chunk *= 2
+    return size, -1
+
+
+def _probe_stride(
+    keys: np.ndarray,
+    tags: np.ndarray,
+    key: int,
+    home: int,
+    stride: int,
+    stop_at_deleted: bool
+) -> Tuple[int, int]:
+    """Probe the slots home, home + stride, home + 2*stride, ... (mod m)."""
+    mask = len(keys) - 1
+    tag = key_tag(key, mask)
+    stops = _STOP_TAG_BYTES[stop_at_deleted][tag]
+    for i in range(min(SCALAR_PROBES, len(keys))):
+        index = (home + i * stride) & mask
+        slot_tag = tags[index]
+        if stops[slot_tag] and (slot_tag >= EMPTY_TAG or keys[index] == key):
+            return i + 1, index
+    return _scan_chunks(keys, tags, key, SCALAR_PROBES, lambda i: (home + i * stride) & mask,
+                        _STOP_TAGS[int(stop_at_deleted), tag])
+
+
+def probe_linear(
+    keys: np.ndarray,
+    tags: np.ndarray,
+    key: int,
+    home: int,
+    stop_at_deleted: bool
+) -> Tuple[int, int]:
+    """
+    Linear probing: h(k,i) = (h'(k) + i) mod m
+    
+    Args:
+        keys: Key array of the table
+        tags: Tag array of the table
+        key: Key to look for
+        home: Home slot h'(k)
+        stop_at_deleted: Also stop at deleted slots (insert reuses them)
+        
+    Returns:
+        Tuple of (number of probes made, slot index holding key or free);
+        the slot index is -1 if no such slot was reached within m probes
+    """
+    return _probe_stride(keys, tags, key, home, 1, stop_at_deleted)
+
+
+def probe_quadratic(
+    keys: np.ndarray,
+    tags: np.ndarray,
+    key: int,
+    home: int,
+    stop_at_deleted: bool
+) -> Tuple[int, int]:
+    """
+    Quadratic probing with triangular numbers: h(k,i) = (h'(k) + i(i+1)/2) mod m
+    
+    The offsets 0, 1, 3, 6, ... visit every slot of a power-of-two table
+    within m probes, so an insert always finds a free slot.
+    
+    Args and return value are as for probe_linear.
+    """
+    mask = len(keys) - 1
+    tag = key_tag(key, mask)
+    stops = _STOP_TAG_BYTES[stop_at_deleted][tag]
+    # Triangular offsets step by 1, 2, 3, ...: one add and mask per probe
+    index = home & mask
+    for i in range(min(SCALAR_PROBES, len(keys))):
+        slot_tag = tags[index]
+        if stops[slot_tag] and (slot_tag >= EMPTY_TAG or keys[index] == key):
+            return i + 1, index
+        index = (index + i + 1) & mask
+    return _scan_chunks(keys, tags, key, SCALAR_PROBES, lambda i: (home + i * (i + 1) // 2) & mask,
+                        _STOP_TAGS[int(stop_at_deleted), tag])
+
+
+def probe_double(
+    keys: np.ndarray,
+    tags: np.ndarray,
+    key: int,
+    home: int,
+    stop_at_deleted: bool
+) -> Tuple[int, int]:
+    """
+    Double hashing: h(k,i) = (h1(k) + i*h2(k)) mod m with h2(k) = floor(k / m) | 1
+    
+    h2 uses the key bits above those of the home slot and is odd, hence
+    coprime with the power-of-two m, so the sequence visits every slot.
+    
+    Args and return value are as for probe_linear.
+    """
+    mask = len(keys) - 1
+    return _probe_stride(keys, tags, key, home, ((key >> mask.bit_length()) | 1) & mask, stop_at_deleted)
+
+
+def robin_hood_scan(
+    keys: np.ndarray,
+    tags: np.ndarray,
+    dist: np.ndarray,
+    index: int,
+    distance: int,
+    key: Optional[int]
+) -> Tuple[int, int]:
+    """
+    Scan slots linearly for where a Robin Hood probe stops.
+    
+    The scan starts at slot index, at the given distance from the home
+    slot of the entry being placed, and stops at the first slot that is
+    empty, holds key, or holds an entry closer to its own home slot.
+    Robin Hood tables never contain deleted slots.
+    
+    Args:
+        keys: Key array of the table
+        tags: Tag array of the table
+        dist: Distance of each slot's entry from its home slot
+        index: Slot to start at
+        distance: Distance of index from the probing entry's home slot
+        key: Key to stop at, or None to stop only at empty/richer slots
+        
+    Returns:
+        Tuple of (number of slots visited, slot index); the slot index is
+        -1 if the probing entry reached distance m without stopping
+    """
+    size = len(keys)
+    mask = size - 1
+    # With no key to match, use a tag no occupied slot has
+    tag = EMPTY_TAG if key is None else key_tag(key, mask)
+    remaining = size - distance
+    for step in range(min(SCALAR_PROBES, max(remaining, 0))):
+        slot = (index + step) & mask
+        slot_tag = tags[slot]
+        if (slot_tag == EMPTY_TAG or dist[slot] < distance + step
+                or (slot_tag == tag and keys[slot] == key)):
+            return step + 1, slot
+    
+    keys, tags, dist = np.asarray(keys), np.asarray(tags), np.asarray(dist)
+    start = SCALAR_PROBES
+    chunk = PROBE_CHUNK
+    while start < remaining:
+        stop = min(start + chunk, remaining)
+        steps = np.arange(start, stop, dtype=np.int64)
+        slots = (index + steps) & mask
+        window = tags[slots]
+        stops = (window == EMPTY_TAG) | (dist[slots] < distance + steps)
+        if key is not None:
+            stops |= (window == tag) & (keys[slots] == key)
+        hits = stops.nonzero()[0]
+        if hits.size:
+            first = int(hits[0])
+            return start + first + 1, int(slots[first])
+        start = stop
+        chunk *= 2
+    return max(remaining, 0), -1
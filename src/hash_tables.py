@@ -7,8 +7,44 @@ This module implements various hash table data structures including:
 - Separate chaining
 """
 
-from typing import Any, Optional, Tuple, List, Callable
+from typing import Any, Optional, Tuple, List, Callable, Iterable
+import math
+import operator
+from itertools import repeat
+import numpy as np
 from .hash_functions import division_hash, get_hash_function
+from .hash_kernels import (
+    EMPTY_TAG,
+    DELETED_TAG,
+    key_tag,
+    probe_linear,
+    probe_quadratic,
+    probe_double,
+    robin_hood_scan
+)
+
+
+def _resize_point(size: int, threshold: float) -> int:
+    """
+    Smallest count n with n / size >= threshold, where insert resizes.
+    
+    ceil(size * threshold) can be off by one when the product rounds (e.g.
+    25 * 0.28 == 7.000000000000001), so the estimate is corrected against
+    the float comparison it replaces.
+    
+    Args:
+        size: Table size
+        threshold: Load factor threshold
+        
+    Returns:
+        Count at which the table resizes
+    """
+    count = math.ceil(size * threshold)
+    while count > 0 and (count - 1) / size >= threshold:
+        count -= 1
+    while count / size < threshold:
+        count += 1
+    return count
 
 
 class DirectAddressTable:
@@ -17,6 +53,9 @@ class DirectAddressTable:
     
     Assumes keys are integers in a small range [0, m-1].
     Provides O(1) operations but requires keys to be in a known range.
+    
+    The slots are a NumPy object array, so insert_many and search_many
+    store and fetch a whole batch of keys with one fancy-indexing operation.
     """
     
     def __init__(self, size: int):
@@ -27,7 +66,8 @@ class DirectAddressTable:
             size: Maximum key value (keys must be in range [0, size-1])
         """
         self.size = size
-        self.table: List[Optional[Any]] = [None] * size
+        self.table = np.empty(size, dtype=object)
+        self.table.fill(None)
     
     def insert(self, key: int, value: Any) -> None:
         """
@@ -64,149 +104,607 @@ class DirectAddressTable:
         """
         if 0 <= key < self.size:
             self.table[key] = None
+    
+    def insert_many(self, keys: Iterable[int], values: Optional[Iterable[Any]] = None) -> None:
+        """
+        Insert many key-value pairs with one indexed assignment.
+        
+        The keys are range-checked before anything is stored. As with
+        repeated insert calls, the last value given for a repeated key wins.
+        
+        Args:
+            keys: Integer keys (a sequence or NumPy integer array)
+            values: Values to store, in the same order as keys (defaults to the keys)
+        """
+        try:
+            slots = np.asarray(keys if isinstance(keys, np.ndarray) else list(keys), dtype=np.int64)
+        except OverflowError:
+            raise ValueError(f"Keys out of range [0, {self.size-1}]") from None
+        if not ((slots >= 0) & (slots < self.size)).all():
+            raise ValueError(f"Keys out of range [0, {self.size-1}]")
+        
+        if values is None:
+            values = slots.tolist()
+        # fromiter keeps sequence values as single objects instead of broadcasting them
+        self.table[slots] = np.fromiter(values, dtype=object, count=len(slots))
+    
+    def search_many(self, keys: Iterable[int]) -> List[Optional[Any]]:
+        """
+        Search for many keys with one indexed lookup.
+        
+        Args:
+            keys: Integer keys to search for (a sequence or NumPy integer array)
+            
+        Returns:
+            List with the value for each key (None where not found or out of range)
+        """
+        try:
+            queries = np.asarray(keys if isinstance(keys, np.ndarray) else list(keys), dtype=np.int64)
+        except OverflowError:
+            search = self.search
+            return [search(key) for key in keys]
+        
+        in_range = (queries >= 0) & (queries < self.size)
+        found = np.full(len(queries), None, dtype=object)
+        found[in_range] = self.table[queries[in_range]]
+        return found.tolist()
 
 
 class HashTableOpenAddressing:
     """
     Hash table using open addressing with multiple probing strategies.
     
-    Supports linear probing, quadratic probing, and double hashing.
+    Supports linear probing, quadratic probing, double hashing, and Robin Hood
+    hashing (linear probing where an entry far from its home slot takes the
+    slot of one closer to home, which evens out probe lengths).
+    
+    Keys live in a contiguous int64 NumPy array with the values in a parallel
+    list. The probe loops themselves are the kernels in hash_kernels, which
+    examine long probe sequences a chunk of slots at a time with one
+    vectorized comparison per chunk. Slot state lives in the tag array
+    (EMPTY_TAG, DELETED_TAG, or a tag byte for an occupied slot), so any
+    int64 value can be used as a key. Keys must be integers (anything
+    operator.index accepts, NumPy integers included), also with a custom
+    hash_func: insert, search and delete raise TypeError for other keys and
+    ValueError for integers outside the int64 range.
+    
+    The table size is always a power of two, so probe sequences reduce slot
+    numbers with a bitmask instead of a modulo.
+    
+    Keys, tags and values are deliberately kept in separate arrays rather
+    than one structured (key, value, state) record array: from Python, each
+    field read of a record allocates a NumPy scalar, which costs far more
+    than the cache line a combined record would save, and the vectorized
+    probe scans need the keys and tags contiguous.
     """
     
-    DELETED = object()  # Sentinel for deleted entries
+    EMPTY_TAG = EMPTY_TAG  # Tag of never-used slots
+    DELETED_TAG = DELETED_TAG  # Tag of deleted slots
+    _KEY_MIN = int(np.iinfo(np.int64).min)
+    _KEY_MAX = int(np.iinfo(np.int64).max)
+    _PROBE_KERNELS = {
+        'linear': probe_linear,
+        'quadratic': probe_quadratic,
+        'double': probe_double,
+        'robin_hood': probe_linear,
+    }
     
     def __init__(
         self,
         size: int,
         hash_func: Optional[Callable] = None,
         probe_type: str = 'linear',
-        load_factor_threshold: float = 0.75
+        load_factor_threshold: float = 0.75,
+        stats: bool = True
     ):
         """
         Initialize hash table with open addressing.
         
         Args:
-            size: Initial size of hash table
+            size: Initial size of hash table (rounded up to a power of two)
             hash_func: Hash function to use (default: division method)
-            probe_type: Type of probing ('linear', 'quadratic', 'double')
-            load_factor_threshold: Maximum load factor before resizing
+            probe_type: Type of probing ('linear', 'quadratic', 'double', 'robin_hood')
+            load_factor_threshold: Maximum load factor before resizing, in (0, 1]
+            stats: Count probes and key comparisons; without it operations
+                skip the counter updates and the counts stay 0
+                
+        Raises:
+            ValueError: If probe_type is unknown or load_factor_threshold is
+                outside (0, 1]
         """
-        self.size = size
+        if not 0 < load_factor_threshold <= 1:
+            raise ValueError(f"Load factor threshold must be in (0, 1], got {load_factor_threshold}")
+        self.size = 1 << (size - 1).bit_length()
+        self.mask = self.size - 1  # k mod size == k & mask for a power-of-two size
         self.count = 0
-        self.table: List[Optional[Tuple[int, Any]]] = [None] * size
-        self.hash_func = hash_func or (lambda k, s: division_hash(k, s))
+        self._deleted = 0  # Slots marked DELETED_TAG, which insert can reuse
+        self.keys = np.zeros(self.size, dtype=np.int64)  # Only meaningful where the tag marks the slot occupied
+        self.tags = np.full(self.size, self.EMPTY_TAG, dtype=np.uint8)  # Slot state and filter bytes, see hash_kernels
+        self.values: List[Any] = [None] * self.size
+        self.hash_func = hash_func or division_hash
+        # The default division hash is inlined as a mask
+        self._mask_hash = hash_func is None
+        if probe_type not in self._PROBE_KERNELS:
+            raise ValueError(f"Unknown probe type: {probe_type}")
         self.probe_type = probe_type
+        # Operations branch on these instead of comparing probe_type strings
+        self._probe_impl = self._PROBE_KERNELS[probe_type]
+        self._robin_hood = probe_type == 'robin_hood'
+        # Distance of each slot's entry from its home slot; only Robin Hood
+        # tables keep one, so the other probe types carry no per-slot extra
+        self.dist: Optional[np.ndarray] = np.zeros(self.size, dtype=np.int64) if self._robin_hood else None
+        self._bind_views()
         self.load_factor_threshold = load_factor_threshold
+        # Insert resizes once count reaches this, i.e. count / size >= threshold
+        self._resize_at = _resize_point(self.size, load_factor_threshold)
+        self._stats = stats
         self._probe_count = 0
         self._comparison_count = 0
     
+    def _bind_views(self) -> None:
+        """
+        Bind memoryviews of the slot arrays for single-slot reads and writes.
+        
+        Indexing a memoryview reads or writes a Python int about twice as
+        fast as ndarray.item() or ndarray item assignment, and the views share
+        the arrays' buffers. Vectorized code keeps using the arrays.
+        """
+        self._keys_view = memoryview(self.keys)
+        self._tags_view = memoryview(self.tags)
+        self._dist_view = memoryview(self.dist) if self.dist is not None else None
+    
+    def __getstate__(self) -> dict:
+        """Pickle the table without its memoryviews, which cannot be pickled."""
+        state = self.__dict__.copy()
+        for name in ('_keys_view', '_tags_view', '_dist_view'):
+            del state[name]
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled table and rebind its memoryviews."""
+        self.__dict__.update(state)
+        self._bind_views()
+    
     def _load_factor(self) -> float:
         """Calculate current load factor."""
         return self.count / self.size
     
-    def _linear_probe(self, key: int, i: int) -> int:
-        """Linear probing: h(k,i) = (h'(k) + i) mod m"""
-        h1 = self.hash_func(key, self.size)
-        return (h1 + i) % self.size
-    
-    def _quadratic_probe(self, key: int, i: int) -> int:
-        """Quadratic probing: h(k,i) = (h'(k) + c1*i + c2*i^2) mod m"""
-        h1 = self.hash_func(key, self.size)
-        c1, c2 = 1, 1
-        return (h1 + c1 * i + c2 * i * i) % self.size
-    
-    def _double_hash(self, key: int, i: int) -> int:
-        """Double hashing: h(k,i) = (h1(k) + i*h2(k)) mod m"""
-        h1 = self.hash_func(key, self.size)
-        # Second hash function: h2(k) = 1 + (k mod (m-1))
-        h2 = 1 + (key % (self.size - 1))
-        return (h1 + i * h2) % self.size
-    
-    def _probe(self, key: int, i: int) -> int:
-        """Get probe sequence index based on probe type."""
-        if self.probe_type == 'linear':
-            return self._linear_probe(key, i)
-        elif self.probe_type == 'quadratic':
-            return self._quadratic_probe(key, i)
-        elif self.probe_type == 'double':
-            return self._double_hash(key, i)
+    def _check_key(self, key: Any) -> int:
+        """
+        Convert key to a Python int, rejecting keys the key array cannot hold.
+        
+        Args:
+            key: Key passed to insert, search or delete
+            
+        Returns:
+            The key as an int
+            
+        Raises:
+            TypeError: If key is not an integer
+            ValueError: If key is outside the int64 range
+        """
+        try:
+            key = operator.index(key)
+        except TypeError:
+            raise TypeError(f"Keys must be integers, not {type(key).__name__}") from None
+        if not self._KEY_MIN <= key <= self._KEY_MAX:
+            raise ValueError(f"Key {key} cannot be stored (outside int64)")
+        return key
+    
+    def _home(self, key: int) -> int:
+        """Home slot of key."""
+        return key & self.mask if self._mask_hash else self.hash_func(key, self.size)
+    
+    def _find_slot(self, key: int, stop_at_deleted: bool) -> Tuple[int, int]:
+        """
+        Follow key's probe sequence to the first slot holding key or free.
+        
+        Args:
+            key: Key to look for
+            stop_at_deleted: Also stop at deleted slots (insert reuses them)
+            
+        Returns:
+            Tuple of (number of probes made, slot index); the slot index is -1
+            if no such slot was reached within size probes
+        """
+        home = key & self.mask if self._mask_hash else self.hash_func(key, self.size)
+        return self._probe_impl(self._keys_view, self._tags_view, key, home, stop_at_deleted)
+    
+    def _resize(self, new_size: Optional[int] = None) -> None:
+        """
+        Resize table when load factor exceeds threshold (default: double the size).
+        
+        Entries are placed straight into the new arrays instead of going
+        through insert: the keys are known to be distinct and the new table
+        has no deleted slots, so each one goes to the first free slot of its
+        probe sequence. Rehashing does not add to the probe and comparison
+        counters.
+        """
+        old_keys = self.keys
+        old_tags = self.tags
+        old_values = self.values
+        self.size = 1 << ((new_size or self.size * 2) - 1).bit_length()
+        self.mask = self.size - 1
+        self._resize_at = _resize_point(self.size, self.load_factor_threshold)
+        self.keys = np.zeros(self.size, dtype=np.int64)
+        self.tags = np.full(self.size, self.EMPTY_TAG, dtype=np.uint8)
+        self.values = [None] * self.size
+        self.dist = np.zeros(self.size, dtype=np.int64) if self._robin_hood else None
+        self._deleted = 0
+        self._bind_views()
+        
+        occupied = np.flatnonzero(old_tags < self.EMPTY_TAG)
+        moved_keys = old_keys[occupied]
+        moved_values = [old_values[index] for index in occupied.tolist()]
+        
+        if self._robin_hood:
+            # Placement must keep runs ordered by home slot, so it goes through
+            # the swapping insert; its counts are discarded.
+            counts = self._probe_count, self._comparison_count
+            self.count = 0
+            for key, value in zip(moved_keys.tolist(), moved_values):
+                self._robin_hood_insert(key, value)
+            self._probe_count, self._comparison_count = counts
+            return
+        
+        if self._mask_hash:
+            homes = (moved_keys & self.mask).tolist()
         else:
-            raise ValueError(f"Unknown probe type: {self.probe_type}")
+            homes = [self.hash_func(key, self.size) for key in moved_keys.tolist()]
+        tags = ((moved_keys >> self.mask.bit_length()) & 0x7F).tolist()
+        
+        # Each entry goes to the first empty slot of its probe sequence,
+        # followed inline rather than through a probe kernel: there are no
+        # keys to compare and no deleted slots to tell apart
+        keys, slot_tags, values, mask = self._keys_view, self._tags_view, self.values, self.mask
+        if self.probe_type == 'quadratic':
+            for key, value, index, tag in zip(moved_keys.tolist(), moved_values, homes, tags):
+                step = 1
+                while slot_tags[index] != EMPTY_TAG:
+                    index = (index + step) & mask
+                    step += 1
+                keys[index] = key
+                slot_tags[index] = tag
+                values[index] = value
+        else:
+            # Linear probing steps by 1, double hashing by the key's odd stride
+            if self.probe_type == 'double':
+                strides = (((moved_keys >> mask.bit_length()) | 1) & mask).tolist()
+            else:
+                strides = repeat(1)
+            for key, value, index, tag, stride in zip(moved_keys.tolist(), moved_values, homes, tags, strides):
+                while slot_tags[index] != EMPTY_TAG:
+                    index = (index + stride) & mask
+                keys[index] = key
+                slot_tags[index] = tag
+                values[index] = value
+        self.count = len(moved_values)
     
-    def _resize(self) -> None:
-        """Resize table when load factor exceeds threshold."""
-        old_table = self.table
-        old_size = self.size
-        self.size *= 2
-        self.count = 0
-        self.table = [None] * self.size
+    def reserve(self, n: int) -> None:
+        """
+        Grow the table so that n elements fit without any further resizing.
         
-        # Rehash all existing entries
-        for entry in old_table:
-            if entry is not None and entry is not self.DELETED:
-                key, value = entry
-                self.insert(key, value)
+        The size is doubled (as on a regular resize) until inserting the
+        n-th element no longer crosses the load factor threshold, and the
+        table is rehashed once.
+        
+        Args:
+            n: Number of elements the table must hold
+        """
+        new_size = self.size
+        while (n - 1) / new_size >= self.load_factor_threshold:
+            new_size *= 2
+        if new_size != self.size:
+            self._resize(new_size)
     
     def insert(self, key: int, value: Any) -> None:
         """
         Insert key-value pair using open addressing.
         
+        The key is looked up before the resize check: updating an existing
+        key never resizes, and a new key found to need a larger table is
+        placed by retrying there (the probes in the old table are not counted).
+        
         Args:
-            key: Key to insert
+            key: Key to insert (an int64 value)
             value: Value to store
+            
+        Raises:
+            TypeError: If key is not an integer
+            ValueError: If key is outside the int64 range
         """
-        if self._load_factor() >= self.load_factor_threshold:
+        if type(key) is not int or not self._KEY_MIN <= key <= self._KEY_MAX:
+            key = self._check_key(key)
+        
+        if self._robin_hood:
+            self._robin_hood_insert(key, value)
+            return
+        
+        tags = self._tags_view
+        mask = self.mask
+        home = key & mask if self._mask_hash else self.hash_func(key, self.size)
+        tag = (key >> mask.bit_length()) & 0x7F
+        # An empty home slot means the key is absent: place it there, as in search
+        if tags[home] == EMPTY_TAG:
+            if self.count >= self._resize_at:
+                self._resize()
+                self.insert(key, value)
+                return
+            if self._stats:
+                self._probe_count += 1
+            self._keys_view[home] = key
+            tags[home] = tag
+            self.values[home] = value
+            self.count += 1
+            return
+        
+        # Look for the key past deleted slots, so an update never stores a
+        # second copy of it in an earlier deleted slot
+        probes, index = self._probe_impl(self._keys_view, tags, key, home, False)
+        # Stopped at an occupied slot: it holds the key
+        found = index >= 0 and tags[index] < EMPTY_TAG
+        if not found and self.count >= self._resize_at:
             self._resize()
+            self.insert(key, value)
+            return
+        if self._stats:
+            self._probe_count += probes
+            # Every probe compared against a stored key, except a stop at a free slot
+            self._comparison_count += probes - 1 if index >= 0 and not found else probes
         
-        i = 0
-        while i < self.size:
-            index = self._probe(key, i)
-            self._probe_count += 1
-            entry = self.table[index]
+        if found:
+            self.values[index] = value
+            return
+        # The key is new: reuse the first deleted slot on its probe sequence,
+        # if the table has any, or take the empty slot the search stopped at
+        if self._deleted:
+            _, index = self._probe_impl(self._keys_view, tags, key, home, True)
+            if index >= 0 and tags[index] == DELETED_TAG:
+                self._deleted -= 1
+        if index < 0:
+            # Every slot is taken, which the resize point should rule out:
+            # grow the table and retry rather than fail.
+            self._resize()
+            self.insert(key, value)
+        else:
+            self._keys_view[index] = key
+            tags[index] = tag
+            self.values[index] = value
+            self.count += 1
+    
+    def _robin_hood_insert(self, key: int, value: Any) -> None:
+        """
+        Robin Hood insertion along the linear probe sequence.
+        
+        Whenever the resident entry is closer to its home slot than the entry
+        being placed, the two swap and probing continues with the displaced
+        resident. Entries in a run are therefore ordered by home slot, so the
+        key cannot appear after a resident closer to home than the probe.
+        As in insert, the resize check waits until the key is known to be new.
+        """
+        keys, tags, values, dist, mask = self._keys_view, self._tags_view, self.values, self._dist_view, self.mask
+        index = self._home(key)
+        placing_key, placing_value, placing_tag = key, value, key_tag(key, mask)
+        distance = 0  # Distance of index from the home slot of the entry being placed
+        displaced = False
+        stats = self._stats
+        
+        while True:
+            steps, slot = robin_hood_scan(keys, tags, dist, index, distance, None if displaced else key)
+            if (not displaced and slot >= 0 and self.count >= self._resize_at
+                    and (tags[slot] == EMPTY_TAG or keys[slot] != key)):
+                # A new key at the resize point: place it in the grown table instead
+                self._resize()
+                self.insert(key, value)
+                return
+            if stats:
+                self._probe_count += steps
             
-            if entry is None or entry is self.DELETED:
-                self.table[index] = (key, value)
-                self.count += 1
+            if slot < 0:
+                if stats and not displaced:
+                    self._comparison_count += steps
+                # No free slot, which the resize point should rule out: grow and place the entry still in hand
+                self._resize()
+                self.insert(placing_key, placing_value)
                 return
-            elif entry[0] == key:
-                self._comparison_count += 1
-                # Update existing key
-                self.table[index] = (key, value)
+            
+            slot_distance = distance + steps - 1
+            
+            if tags[slot] == self.EMPTY_TAG:
+                if stats and not displaced:
+                    self._comparison_count += steps - 1
+                keys[slot] = placing_key
+                tags[slot] = placing_tag
+                values[slot] = placing_value
+                dist[slot] = slot_distance
+                self.count += 1
                 return
-            else:
-                self._comparison_count += 1
             
-            i += 1
+            resident_key = keys[slot]
+            if not displaced:
+                if stats:
+                    self._comparison_count += steps
+                if resident_key == key:
+                    # Update existing key
+                    values[slot] = value
+                    return
+            
+            # The resident is richer (closer to home): it gives up its slot
+            resident_value = values[slot]
+            resident_tag = tags[slot]
+            resident_distance = dist[slot]
+            keys[slot] = placing_key
+            tags[slot] = placing_tag
+            values[slot] = placing_value
+            dist[slot] = slot_distance
+            placing_key, placing_value, placing_tag = resident_key, resident_value, resident_tag
+            distance = resident_distance + 1
+            index = (slot + 1) & mask
+            displaced = True
+    
+    def _robin_hood_find(self, key: int) -> Optional[int]:
+        """Return the slot holding key in a Robin Hood table, or None."""
+        tags = self._tags_view
+        mask = self.mask
+        home = key & mask if self._mask_hash else self.hash_func(key, self.size)
+        # No resident is closer to home than distance 0, so the home slot
+        # ends the scan only if it is empty or holds the key
+        home_tag = tags[home]
+        if home_tag == EMPTY_TAG:
+            if self._stats:
+                self._probe_count += 1
+            return None
+        if home_tag == (key >> mask.bit_length()) & 0x7F and self._keys_view[home] == key:
+            if self._stats:
+                self._probe_count += 1
+                self._comparison_count += 1
+            return home
         
-        raise RuntimeError("Hash table is full")
+        probes, index = robin_hood_scan(self._keys_view, tags, self._dist_view, home, 0, key)
+        # The scan also stops at richer residents, so an occupied stop needs a key check.
+        # Otherwise it stopped at an empty slot or a resident closer to home than the
+        # probe: the key would have displaced it, so it is not in the table.
+        found = index >= 0 and tags[index] != self.EMPTY_TAG and self._keys_view[index] == key
+        if self._stats:
+            self._probe_count += probes
+            self._comparison_count += probes - 1 if index >= 0 and not found else probes
+        return index if found else None
     
     def search(self, key: int) -> Optional[Any]:
         """
         Search for value by key.
         
         Args:
-            key: Key to search for
+            key: Key to search for (an int64 value)
             
         Returns:
             Value if found, None otherwise
-        """
-        i = 0
-        while i < self.size:
-            index = self._probe(key, i)
-            self._probe_count += 1
-            entry = self.table[index]
             
-            if entry is None:
-                return None
-            elif entry is not self.DELETED and entry[0] == key:
+        Raises:
+            TypeError: If key is not an integer
+            ValueError: If key is outside the int64 range
+        """
+        if type(key) is not int or not self._KEY_MIN <= key <= self._KEY_MAX:
+            key = self._check_key(key)
+        
+        if self._robin_hood:
+            index = self._robin_hood_find(key)
+            return None if index is None else self.values[index]
+        
+        tags = self._tags_view
+        mask = self.mask
+        home = key & mask if self._mask_hash else self.hash_func(key, self.size)
+        # Most searches end at the home slot: check it before calling the kernel
+        home_tag = tags[home]
+        if home_tag == EMPTY_TAG:
+            if self._stats:
+                self._probe_count += 1
+            return None
+        if home_tag == (key >> mask.bit_length()) & 0x7F and self._keys_view[home] == key:
+            if self._stats:
+                self._probe_count += 1
                 self._comparison_count += 1
-                return entry[1]
+            return self.values[home]
+        
+        probes, index = self._probe_impl(self._keys_view, tags, key, home, False)
+        # Stopping at an occupied slot means it holds the key
+        found = index >= 0 and tags[index] < EMPTY_TAG
+        if self._stats:
+            self._probe_count += probes
+            self._comparison_count += probes - 1 if index >= 0 and not found else probes
+        return self.values[index] if found else None
+    
+    def insert_many(self, keys: Iterable[Any], values: Optional[Iterable[Any]] = None) -> None:
+        """
+        Insert many key-value pairs.
+        
+        Args:
+            keys: Keys to insert
+            values: Values to store, in the same order as keys (defaults to the keys)
+        """
+        if values is None:
+            values = keys
+        insert = self.insert
+        for key, value in zip(keys, values):
+            insert(key, value)
+    
+    def search_many(self, keys: Iterable[Any]) -> List[Optional[Any]]:
+        """
+        Search for many keys at once.
+        
+        All keys advance through their probe sequences together: step i
+        gathers the i-th probe slot of every unresolved key with one NumPy
+        indexing operation and retires the keys that hit or reach a stopping
+        slot. The Python overhead is per probe step rather than per key, and
+        the probe and comparison counts are the same as for searching the
+        keys one by one.
+        
+        Args:
+            keys: Keys to search for (a sequence or NumPy integer array)
+            
+        Returns:
+            List with the value for each key (None where not found)
+            
+        Raises:
+            TypeError: If a key is not an integer
+            ValueError: If a key is outside the int64 range
+        """
+        keys = keys if isinstance(keys, np.ndarray) else list(keys)
+        queries = np.asarray(keys)
+        if not len(queries):
+            return []
+        if queries.dtype.kind != 'i':
+            # Not a signed integer array (other key types, or integers NumPy
+            # could not fit in int64): search key by key, which validates them
+            search = self.search
+            return [search(key) for key in keys]
+        queries = queries.astype(np.int64, copy=False)
+        
+        mask = self.mask
+        if self._mask_hash:
+            homes = queries & mask
+        else:
+            homes = np.array([self.hash_func(key, self.size) for key in queries.tolist()], dtype=np.int64)
+        if self.probe_type == 'double':
+            strides = ((queries >> mask.bit_length()) | 1) & mask
+        
+        table_keys, table_tags = self.keys, self.tags
+        found = np.full(len(queries), -1, dtype=np.int64)
+        active = np.arange(len(queries))
+        probes = comparisons = 0
+        step = 0
+        while active.size and step < self.size:
+            if self.probe_type == 'quadratic':
+                slots = (homes[active] + step * (step + 1) // 2) & mask
+            elif self.probe_type == 'double':
+                slots = (homes[active] + step * strides[active]) & mask
             else:
-                self._comparison_count += 1
+                slots = (homes[active] + step) & mask
+            slot_tags = table_tags[slots]
+            
+            hit = (slot_tags < self.EMPTY_TAG) & (table_keys[slots] == queries[active])
+            miss = slot_tags == self.EMPTY_TAG
+            if self._robin_hood:
+                # A resident closer to home than the probe ends the search
+                miss |= ~hit & (self.dist[slots] < step)
+            found[active[hit]] = slots[hit]
             
-            i += 1
+            hits, misses = int(np.count_nonzero(hit)), int(np.count_nonzero(miss))
+            probes += (step + 1) * (hits + misses)
+            # A miss does not compare against the slot that stopped it
+            comparisons += (step + 1) * hits + step * misses
+            active = active[~(hit | miss)]
+            step += 1
+        
+        # Keys still unresolved probed every slot
+        probes += self.size * active.size
+        comparisons += self.size * active.size
+        if self._stats:
+            self._probe_count += probes
+            self._comparison_count += comparisons
         
-        return None
+        values = self.values
+        return [values[index] if index >= 0 else None for index in found.tolist()]
     
     def get_probe_count(self) -> int:
         """Get total number of probes performed."""
@@ -226,47 +724,78 @@ class HashTableOpenAddressing:
         Delete key-value pair.
         
         Args:
-            key: Key to delete
+            key: Key to delete (an int64 value)
             
         Returns:
             True if deleted, False if not found
-        """
-        i = 0
-        while i < self.size:
-            index = self._probe(key, i)
-            entry = self.table[index]
             
-            if entry is None:
-                return False
-            elif entry is not self.DELETED and entry[0] == key:
-                self.table[index] = self.DELETED
-                self.count -= 1
-                return True
-            
-            i += 1
+        Raises:
+            TypeError: If key is not an integer
+            ValueError: If key is outside the int64 range
+        """
+        if type(key) is not int or not self._KEY_MIN <= key <= self._KEY_MAX:
+            key = self._check_key(key)
+        
+        if self._robin_hood:
+            return self._robin_hood_delete(key)
+        
+        _, index = self._find_slot(key, stop_at_deleted=False)
+        if index < 0 or self._tags_view[index] >= self.EMPTY_TAG:
+            return False
         
-        return False
+        self._tags_view[index] = self.DELETED_TAG
+        self.values[index] = None
+        self.count -= 1
+        self._deleted += 1
+        return True
+    
+    def _robin_hood_delete(self, key: int) -> bool:
+        """
+        Delete from a Robin Hood table by backward shift instead of a tombstone.
+        
+        Following entries that are away from their home slot each move back
+        one slot, which keeps runs ordered by home slot for _robin_hood_find.
+        """
+        index = self._robin_hood_find(key)
+        if index is None:
+            return False
+        
+        keys, tags, values, dist, mask = self._keys_view, self._tags_view, self.values, self._dist_view, self.mask
+        next_index = (index + 1) & mask
+        next_distance = dist[next_index]
+        # Empty slots keep distance 0, so a positive distance means an entry to move
+        while next_distance > 0:
+            keys[index] = keys[next_index]
+            tags[index] = tags[next_index]
+            values[index] = values[next_index]
+            dist[index] = next_distance - 1
+            index = next_index
+            next_index = (index + 1) & mask
+            next_distance = dist[next_index]
+        
+        tags[index] = self.EMPTY_TAG
+        values[index] = None
+        dist[index] = 0
+        self.count -= 1
+        return True
 
 
 class HashTableSeparateChaining:
     """
     Hash table using separate chaining for collision resolution.
     
-    Each bucket contains a linked list of key-value pairs.
+    Each bucket holds its chain as two parallel Python lists, one of keys and
+    one of values, created on the first insert into the bucket. A chain is
+    scanned with list.index, a C loop over a contiguous array of references,
+    instead of following one node object per entry.
     """
     
-    class Node:
-        """Node for linked list in separate chaining."""
-        def __init__(self, key: int, value: Any):
-            self.key = key
-            self.value = value
-            self.next: Optional['HashTableSeparateChaining.Node'] = None
-    
     def __init__(
         self,
         size: int,
         hash_func: Optional[Callable] = None,
-        load_factor_threshold: float = 1.0
+        load_factor_threshold: float = 1.0,
+        stats: bool = True
     ):
         """
         Initialize hash table with separate chaining.
@@ -274,60 +803,121 @@ class HashTableSeparateChaining:
         Args:
             size: Initial size of hash table
             hash_func: Hash function to use (default: division method)
-            load_factor_threshold: Maximum load factor before resizing
+            load_factor_threshold: Maximum load factor before resizing (positive;
+                above 1 chains average more than one key before a resize)
+            stats: Count key comparisons; without it operations skip the
+                counter updates and the count stays 0
+                
+        Raises:
+            ValueError: If load_factor_threshold is not positive
         """
+        if not load_factor_threshold > 0:
+            raise ValueError(f"Load factor threshold must be positive, got {load_factor_threshold}")
         self.size = size
         self.count = 0
-        self.buckets: List[Optional[self.Node]] = [None] * size
-        self.hash_func = hash_func or (lambda k, s: division_hash(k, s))
+        self.buckets: List[Optional[Tuple[List[Any], List[Any]]]] = [None] * size
+        self.hash_func = hash_func or division_hash
+        # The default division hash is inlined as a modulo
+        self._mod_hash = hash_func is None
         self.load_factor_threshold = load_factor_threshold
+        # Insert resizes once count reaches this, i.e. count / size >= threshold
+        self._resize_at = _resize_point(size, load_factor_threshold)
+        self._stats = stats
         self._comparison_count = 0
     
     def _load_factor(self) -> float:
         """Calculate current load factor."""
         return self.count / self.size
     
-    def _resize(self) -> None:
-        """Resize table when load factor exceeds threshold."""
+    def _resize(self, new_size: Optional[int] = None) -> None:
+        """
+        Resize table when load factor exceeds threshold (default: double the size).
+        
+        Entries are appended straight to their new chains instead of being
+        reinserted: keys are known to be distinct, so no duplicate check is
+        needed, and the count is unchanged.
+        """
         old_buckets = self.buckets
-        old_size = self.size
-        self.size *= 2
-        self.count = 0
-        self.buckets = [None] * self.size
+        self.size = new_size or self.size * 2
+        self._resize_at = _resize_point(self.size, self.load_factor_threshold)
+        buckets: List[Optional[Tuple[List[Any], List[Any]]]] = [None] * self.size
+        hash_func, size, mod_hash = self.hash_func, self.size, self._mod_hash
+        
+        moved_keys: List[Any] = []
+        moved_values: List[Any] = []
+        for bucket in old_buckets:
+            if bucket is not None:
+                moved_keys += bucket[0]
+                moved_values += bucket[1]
+        
+        for key, value in zip(moved_keys, moved_values):
+            index = key % size if mod_hash else hash_func(key, size)
+            chain = buckets[index]
+            if chain is None:
+                buckets[index] = ([key], [value])
+            else:
+                chain[0].append(key)
+                chain[1].append(value)
+        self.buckets = buckets
+    
+    def reserve(self, n: int) -> None:
+        """
+        Grow the table so that n elements fit without any further resizing.
+        
+        The size is doubled (as on a regular resize) until inserting the
+        n-th element no longer crosses the load factor threshold, and the
+        table is rehashed once.
         
-        # Rehash all existing entries
-        for head in old_buckets:
-            current = head
-            while current is not None:
-                self.insert(current.key, current.value)
-                current = current.next
+        Args:
+            n: Number of elements the table must hold
+        """
+        new_size = self.size
+        while (n - 1) / new_size >= self.load_factor_threshold:
+            new_size *= 2
+        if new_size != self.size:
+            self._resize(new_size)
     
     def insert(self, key: int, value: Any) -> None:
         """
         Insert key-value pair.
         
+        As in open addressing, the chain is checked before the resize test,
+        so updating an existing key never resizes.
+        
         Args:
             key: Key to insert
             value: Value to store
         """
-        if self._load_factor() >= self.load_factor_threshold:
-            self._resize()
+        index = key % self.size if self._mod_hash else self.hash_func(key, self.size)
+        bucket = self.buckets[index]
+        if bucket is not None:
+            try:
+                position = bucket[0].index(key)
+            except ValueError:
+                pass
+            else:
+                if self._stats:
+                    self._comparison_count += position + 1
+                bucket[1][position] = value  # Update existing key
+                return
         
-        index = self.hash_func(key, self.size)
+        if self.count >= self._resize_at:
+            # A new key at the resize point: place it in the grown table
+            self._resize()
+            self.insert(key, value)
+            return
         
-        # Check if key already exists
-        current = self.buckets[index]
-        while current is not None:
-            self._comparison_count += 1
-            if current.key == key:
-                current.value = value  # Update existing key
-                return
-            current = current.next
+        if bucket is None:
+            self.buckets[index] = ([key], [value])
+            self.count += 1
+            return
         
-        # Insert new node at head of chain
-        new_node = self.Node(key, value)
-        new_node.next = self.buckets[index]
-        self.buckets[index] = new_node
+        keys, values = bucket
+        # A new key was compared with the whole chain
+        if self._stats:
+            self._comparison_count += len(keys)
+        keys.append(key)
+        values.append(value)
         self.count += 1
     
     def search(self, key: int) -> Optional[Any]:
@@ -340,16 +930,47 @@ class HashTableSeparateChaining:
         Returns:
             Value if found, None otherwise
         """
-        index = self.hash_func(key, self.size)
-        current = self.buckets[index]
+        bucket = self.buckets[key % self.size if self._mod_hash else self.hash_func(key, self.size)]
+        if bucket is None:
+            return None
         
-        while current is not None:
-            self._comparison_count += 1
-            if current.key == key:
-                return current.value
-            current = current.next
+        keys, values = bucket
+        try:
+            position = keys.index(key)
+        except ValueError:
+            if self._stats:
+                self._comparison_count += len(keys)
+            return None
+        if self._stats:
+            self._comparison_count += position + 1
+        return values[position]
+    
+    def insert_many(self, keys: Iterable[Any], values: Optional[Iterable[Any]] = None) -> None:
+        """
+        Insert many key-value pairs.
         
-        return None
+        Args:
+            keys: Keys to insert
+            values: Values to store, in the same order as keys (defaults to the keys)
+        """
+        if values is None:
+            values = keys
+        insert = self.insert
+        for key, value in zip(keys, values):
+            insert(key, value)
+    
+    def search_many(self, keys: Iterable[Any]) -> List[Optional[Any]]:
+        """
+        Search for many keys.
+        
+        Args:
+            keys: Keys to search for
+            
+        Returns:
+            List with the value for each key (None where not found)
+        """
+        search = self.search
+        return [search(key) for key in keys]
     
     def get_comparison_count(self) -> int:
         """Get total number of key comparisons performed."""
@@ -369,30 +990,19 @@ class HashTableSeparateChaining:
         Returns:
             True if deleted, False if not found
         """
-        index = self.hash_func(key, self.size)
-        current = self.buckets[index]
-        
-        if current is None:
+        bucket = self.buckets[key % self.size if self._mod_hash else self.hash_func(key, self.size)]
+        if bucket is None:
             return False
         
-        # Check if key is at head
-        if current.key == key:
-            self.buckets[index] = current.next
-            self.count -= 1
-            return True
-        
-        # Search in chain
-        prev = current
-        current = current.next
-        while current is not None:
-            if current.key == key:
-                prev.next = current.next
-                self.count -= 1
-                return True
-            prev = current
-            current = current.next
-        
-        return False
+        keys, values = bucket
+        try:
+            position = keys.index(key)
+        except ValueError:
+            return False
+        del keys[position]
+        del values[position]
+        self.count -= 1
+        return True
     
     def get_chain_lengths(self) -> List[int]:
         """
@@ -401,13 +1011,4 @@ class HashTableSeparateChaining:
         Returns:
             List of chain lengths
         """
-        lengths = []
-        for head in self.buckets:
-            length = 0
-            current = head
-            while current is not None:
-                length += 1
-                current = current.next
-            lengths.append(length)
-        return lengths
-
+        return [0 if bucket is None else len(bucket[0]) for bucket in self.buckets]
@@ -10,12 +10,18 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.hash_functions import (
     division_hash,
     multiplication_hash,
+    multiplication_hash_int,
     universal_hash,
     string_hash_simple,
     string_hash_polynomial,
     string_hash_djb2,
     md5_hash,
-    bad_hash_clustering
+    fast_string_hash,
+    bad_hash_clustering,
+    division_hash_vec,
+    multiplication_hash_vec,
+    bad_hash_clustering_vec,
+    get_hash_function
 )
 
 
@@ -55,6 +61,13 @@ class TestMultiplicationHash:
         for key in range(50):
             hash_val = multiplication_hash(key, table_size)
             assert 0 <= hash_val < table_size
+    
+    def test_integer_version(self):
+        """Test the fixed-point golden-ratio multiplication hash."""
+        assert multiplication_hash_int(1, 1024) == multiplication_hash(1, 1024)
+        for table_size in (16, 100, 1024):
+            for key in range(1000):
+                assert 0 <= multiplication_hash_int(key, table_size) < table_size
 
 
 class TestUniversalHash:
@@ -95,6 +108,14 @@ class TestStringHashFunctions:
         hash_val = string_hash_djb2("hello", 11)
         assert 0 <= hash_val < 11
     
+    def test_string_hash_djb2_long_keys(self):
+        """Test that the 4-characters-per-step DJB2 path matches the plain recurrence."""
+        for key in ["x" * 32, "hash tables and hash functions" * 3, "ключ" * 10 + "abc"]:
+            expected = 5381
+            for char in key:
+                expected = ((expected << 5) + expected) + ord(char)
+            assert string_hash_djb2(key, 1009) == expected % 1009
+    
     def test_string_hash_collisions(self):
         """Test that different strings can produce different hashes."""
         table_size = 100
@@ -107,6 +128,12 @@ class TestStringHashFunctions:
         """Test MD5-based hash function."""
         hash_val = md5_hash("test", 11)
         assert 0 <= hash_val < 11
+    
+    def test_fast_string_hash(self):
+        """Test fast non-cryptographic string hash function."""
+        hash_val = fast_string_hash("test", 11)
+        assert 0 <= hash_val < 11
+        assert fast_string_hash("test", 11) == hash_val
 
 
 class TestBadHashFunctions:
@@ -148,3 +175,38 @@ class TestHashFunctionProperties:
         buckets_used = len(bucket_counts)
         assert buckets_used > table_size * 0.5  # At least 50% of buckets used
 
+
+class TestVectorizedHashFunctions:
+    """Tests for array versions of the integer hash functions."""
+    
+    def test_match_scalar_versions(self):
+        """Test that vectorized hashes agree with the scalar functions."""
+        keys = list(range(-50, 500, 7))
+        table_size = 37
+        pairs = [
+            (division_hash_vec, division_hash),
+            (multiplication_hash_vec, multiplication_hash),
+            (bad_hash_clustering_vec, bad_hash_clustering),
+        ]
+        for vec_func, scalar_func in pairs:
+            expected = [scalar_func(k, table_size) for k in keys]
+            assert vec_func(keys, table_size).tolist() == expected
+
+
+class TestGetHashFunction:
+    """Tests for hash function lookup by name."""
+    
+    def test_lookup_by_name(self):
+        """Test that names map to the expected functions."""
+        assert get_hash_function('division') is division_hash
+        assert get_hash_function('md5') is md5_hash
+        assert get_hash_function('multiplication_int') is multiplication_hash_int
+        assert get_hash_function('fast') is fast_string_hash
+    
+    def test_unknown_name_defaults_to_division(self):
+        """Test that unknown names fall back to the division method."""
+        assert get_hash_function('no_such_hash') is division_hash
+    
+    def test_repeated_lookup_returns_same_callable(self):
+        """Test that cached lookups return the same callable."""
+        assert get_hash_function('string_djb2') is get_hash_function('string_djb2')
@@ -0,0 +1,93 @@
+"""
+Tests for open-addressing probe kernels.
+"""
+
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.hash_kernels import (
+    EMPTY_TAG,
+    DELETED_TAG,
+    key_tag,
+    probe_linear,
+    probe_quadratic,
+    probe_double,
+    robin_hood_scan
+)
+
+
+def make_table(size, occupied, deleted=()):
+    """Build key and tag arrays with the given {slot: key} entries and deleted slots."""
+    keys = np.zeros(size, dtype=np.int64)
+    tags = np.full(size, EMPTY_TAG, dtype=np.uint8)
+    for slot, key in occupied.items():
+        keys[slot] = key
+        tags[slot] = key_tag(key, size - 1)
+    for slot in deleted:
+        tags[slot] = DELETED_TAG
+    return keys, tags
+
+
+class TestProbeKernels:
+    """Tests for the probe kernels."""
+    
+    def test_linear_stops_at_key_or_free_slot(self):
+        """Test linear probing finds the key or the first free slot."""
+        keys, tags = make_table(16, {3: 19, 4: 35, 5: 51})
+        assert probe_linear(keys, tags, 35, 3, False) == (2, 4)
+        assert probe_linear(keys, tags, 67, 3, False) == (4, 6)
+    
+    def test_deleted_slots(self):
+        """Test that deleted slots stop the probe only when asked to."""
+        keys, tags = make_table(16, {3: 19, 5: 51}, deleted=[4])
+        assert probe_linear(keys, tags, 51, 3, False) == (3, 5)
+        assert probe_linear(keys, tags, 51, 3, True) == (2, 4)
+    
+    def test_free_slot_keys_ignored(self):
+        """Test that the key array is not read at free slots, so any int64 key works."""
+        keys, tags = make_table(16, {}, deleted=[1])
+        assert probe_linear(keys, tags, 0, 0, False) == (1, 0)
+        keys, tags = make_table(16, {0: 16, 2: 0})
+        assert probe_linear(keys, tags, 0, 0, False) == (2, 1)
+    
+    def test_long_probe_sequence(self):
+        """Test probes past the scalar steps into the vectorized chunks."""
+        entries = {slot: slot * 128 for slot in range(128)}
+        del entries[60]
+        keys, tags = make_table(128, entries)
+        assert probe_linear(keys, tags, 50 * 128, 0, False) == (51, 50)
+        assert probe_linear(keys, tags, 7, 0, False) == (61, 60)
+        keys, tags = make_table(128, {slot: slot * 128 for slot in range(128)})
+        assert probe_linear(keys, tags, 7, 0, False) == (128, -1)
+    
+    def test_quadratic_and_double_sequences(self):
+        """Test quadratic and double-hashing probe sequences."""
+        keys, tags = make_table(16, {0: 16, 1: 32, 3: 48, 6: 64})
+        # Quadratic (triangular offsets): 0, 1, 3, 6, 10
+        assert probe_quadratic(keys, tags, 80, 0, False) == (5, 10)
+        # Double: h2(80) = (80 // 16) | 1 = 5, so 0, 5
+        assert probe_double(keys, tags, 80, 0, False) == (2, 5)
+    
+    def test_sequences_visit_every_slot(self):
+        """Test quadratic and double-hashing probes reach the last free slot."""
+        for free in range(16):
+            keys, tags = make_table(16, {slot: (slot + 1) * 1000 for slot in range(16) if slot != free})
+            assert probe_quadratic(keys, tags, 7, 5, False)[1] == free
+            assert probe_double(keys, tags, 7 + 16 * 6, 5, False)[1] == free
+    
+    def test_key_tag(self):
+        """Test tags take the key bits above the home slot and avoid the state tags."""
+        assert key_tag(0x1234, 0xFF) == 0x12
+        assert key_tag(0xAB00, 0xFF) == 0x2B
+        assert key_tag(-1, 0xFF) == 0x7F
+    
+    def test_robin_hood_scan(self):
+        """Test the Robin Hood scan stops at a richer resident."""
+        keys, tags = make_table(16, {0: 16, 1: 32, 2: 1})
+        dist = np.zeros(16, dtype=np.int64)
+        dist[0:3] = [0, 1, 0]
+        assert robin_hood_scan(keys, tags, dist, 0, 0, 32) == (2, 1)
+        # 48 would be at distance 2 in slot 2, whose resident is at distance 0
+        assert robin_hood_scan(keys, tags, dist, 0, 0, 48) == (3, 2)
@@ -5,6 +5,10 @@ Tests for hash table implementations.
 import pytest
 import sys
 import os
+import pickle
+import gc
+import weakref
+import numpy as np
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.hash_tables import (
@@ -41,6 +45,21 @@ class TestDirectAddressTable:
         with pytest.raises(ValueError):
             table.insert(100, "value")  # Out of range
         assert table.search(100) is None
+    
+    def test_insert_many_and_search_many(self):
+        """Test bulk insert and search, including sequence values and out-of-range keys."""
+        table = DirectAddressTable(100)
+        table.insert_many(np.array([5, 42, 7]), ["value1", ("a", "b"), [1, 2]])
+        table.insert_many([9, 9])
+        
+        assert table.search(42) == ("a", "b")
+        assert table.search_many([5, 42, 7, 9, 10, -1, 100]) == [
+            "value1", ("a", "b"), [1, 2], 9, None, None, None
+        ]
+        assert table.search_many(np.array([], dtype=np.int64)) == []
+        with pytest.raises(ValueError):
+            table.insert_many([1, 100], ["value", "value"])
+        assert table.search(1) is None
 
 
 class TestHashTableOpenAddressing:
@@ -76,6 +95,35 @@ class TestHashTableOpenAddressing:
         assert ht.search(10) == "value1"
         assert ht.search(22) == "value2"
     
+    def test_insert_and_search_robin_hood(self):
+        """Test insert and search with Robin Hood hashing."""
+        ht = HashTableOpenAddressing(16, probe_type='robin_hood')
+        # 16, 32 and 48 share home slot 0; 1 and 17 share home slot 1
+        for key in [16, 1, 32, 17, 48]:
+            ht.insert(key, f"value{key}")
+        
+        for key in [16, 1, 32, 17, 48]:
+            assert ht.search(key) == f"value{key}"
+        assert ht.search(64) is None
+        # Every entry sits at its recorded distance from its home slot
+        for index, key in enumerate(ht.keys.tolist()):
+            if ht.tags[index] != ht.EMPTY_TAG:
+                assert (index - key % ht.size) % ht.size == ht.dist[index]
+    
+    def test_delete_robin_hood(self):
+        """Test Robin Hood delete shifts later entries back instead of leaving tombstones."""
+        ht = HashTableOpenAddressing(16, probe_type='robin_hood')
+        for key in [16, 32, 48, 1]:
+            ht.insert(key, f"value{key}")
+        
+        assert ht.delete(32) is True
+        assert ht.delete(32) is False
+        assert ht.search(32) is None
+        for key in [16, 48, 1]:
+            assert ht.search(key) == f"value{key}"
+        assert ht.DELETED_TAG not in ht.tags
+        assert ht.count == 3
+    
     def test_delete(self):
         """Test delete operation."""
         ht = HashTableOpenAddressing(10, probe_type='linear')
@@ -87,6 +135,164 @@ class TestHashTableOpenAddressing:
         assert ht.search(22) == "value2"
         assert ht.delete(99) is False
     
+    def test_tags_track_slots(self):
+        """Test the tag array follows inserts, deletes and Robin Hood shifts."""
+        for probe_type in ['linear', 'robin_hood']:
+            ht = HashTableOpenAddressing(16, probe_type=probe_type)
+            for key in [16, 32, 48, 1]:
+                ht.insert(key, f"value{key}")
+            ht.delete(32)
+            
+            stored = {}
+            for index, tag in enumerate(ht.tags.tolist()):
+                if tag < ht.EMPTY_TAG:
+                    key = ht.keys[index]
+                    assert tag == (key >> 4) & 0x7F
+                    stored[key] = ht.values[index]
+            assert stored == {16: "value16", 48: "value48", 1: "value1"}
+            assert list(ht.tags).count(ht.DELETED_TAG) == (1 if probe_type == 'linear' else 0)
+    
+    def test_configurations_agree(self):
+        """Test that hash choice and stats flag change neither results nor the table's class."""
+        keys = [(i * 37) % 1000 for i in range(300)]
+        for probe_type in ['linear', 'quadratic', 'double']:
+            for hash_func in [None, lambda k, s: (k * 31) % s]:
+                counted = HashTableOpenAddressing(4, hash_func=hash_func, probe_type=probe_type)
+                uncounted = HashTableOpenAddressing(4, hash_func=hash_func, probe_type=probe_type, stats=False)
+                for ht in (counted, uncounted):
+                    assert type(ht) is HashTableOpenAddressing
+                    assert repr(ht).startswith('<src.hash_tables.HashTableOpenAddressing object')
+                    
+                    insert = ht.insert  # Held across resizes, as bulk callers do
+                    for key in keys:
+                        insert(key, f"value{key}")
+                    for key in keys[::3]:
+                        ht.delete(key)
+                
+                for key in range(1000):
+                    assert counted.search(key) == uncounted.search(key)
+                assert counted.size == uncounted.size
+                assert counted.get_probe_count() > 0
+                assert uncounted.get_probe_count() == 0
+    
+    def test_subclass_overrides_are_kept(self):
+        """Test that subclasses keep their own methods and add no reference cycles."""
+        class LoggingTable(HashTableOpenAddressing):
+            def search(self, key):
+                self.searched.append(key)
+                return super().search(key)
+        
+        ht = LoggingTable(8)
+        ht.searched = []
+        ht.insert(3, "value3")
+        assert ht.search(3) == "value3"
+        assert ht.searched == [3]
+        
+        gc.disable()
+        try:
+            ht = HashTableOpenAddressing(8)
+            ref = weakref.ref(ht)
+            del ht
+            assert ref() is None
+        finally:
+            gc.enable()
+    
+    def test_update_past_deleted_slot(self):
+        """Test that updating a key stored past a deleted slot keeps one copy."""
+        for probe_type in ['linear', 'quadratic', 'double']:
+            ht = HashTableOpenAddressing(8, probe_type=probe_type)
+            ht.insert(0, "first")
+            ht.insert(8, "second")  # Same home slot as 0
+            assert ht.delete(0) is True
+            
+            ht.insert(8, "updated")
+            assert ht.count == 1
+            assert ht.search(8) == "updated"
+            assert ht.delete(8) is True
+            assert ht.search(8) is None
+            
+            # A new key reuses the deleted slot
+            ht.insert(16, "third")
+            assert list(ht.tags).count(ht.DELETED_TAG) == 1
+            assert ht.search(16) == "third"
+    
+    def test_update_at_resize_point_does_not_resize(self):
+        """Test that only a new key triggers the resize, not an update."""
+        for probe_type in ['linear', 'double', 'robin_hood']:
+            ht = HashTableOpenAddressing(8, probe_type=probe_type)
+            ht.insert_many(range(6))
+            ht.insert(3, "updated")
+            assert ht.size == 8
+            assert ht.search(3) == "updated"
+            
+            ht.insert(11, "new")
+            assert ht.size == 16
+            assert ht.search_many([3, 11]) == ["updated", "new"]
+        
+        ht = HashTableSeparateChaining(4)
+        ht.insert_many([0, 4, 1, 2])
+        ht.insert(4, "updated")
+        assert ht.size == 4
+        ht.insert(8, "new")
+        assert ht.size == 8
+        assert ht.search_many([4, 8]) == ["updated", "new"]
+    
+    def test_pickle_round_trip(self):
+        """Test that a pickled table keeps its entries and stays usable."""
+        for probe_type in ['linear', 'robin_hood']:
+            ht = HashTableOpenAddressing(8, probe_type=probe_type)
+            ht.insert_many([3, 11, 19])
+            copy = pickle.loads(pickle.dumps(ht))
+            
+            assert type(copy) is type(ht)
+            assert copy.search_many([3, 11, 19, 27]) == [3, 11, 19, None]
+            copy.insert(27, 27)
+            assert copy.delete(11) is True
+            assert copy.search_many([3, 11, 19, 27]) == [3, None, 19, 27]
+            assert ht.search(27) is None
+    
+    def test_unknown_probe_type(self):
+        """Test that an unknown probe type is rejected."""
+        with pytest.raises(ValueError):
+            HashTableOpenAddressing(10, probe_type='cuckoo')
+    
+    def test_full_int64_key_range(self):
+        """Test that every int64 key can be stored and wider keys are rejected."""
+        for probe_type in ['linear', 'robin_hood']:
+            ht = HashTableOpenAddressing(10, probe_type=probe_type)
+            keys = [0, -1, -2**63, 2**63 - 1]
+            assert ht.search(0) is None
+            for key in keys:
+                ht.insert(key, f"value{key}")
+            
+            assert ht.search_many(keys) == [f"value{key}" for key in keys]
+            assert ht.delete(0) is True
+            assert ht.search(0) is None
+            assert ht.search(-2**63) == f"value{-2**63}"
+            with pytest.raises(ValueError):
+                ht.insert(2**63, "value")
+            with pytest.raises(ValueError):
+                ht.search(2**63)
+            with pytest.raises(ValueError):
+                ht.delete(-2**63 - 1)
+            with pytest.raises(ValueError):
+                ht.search_many([1, 2**63])
+    
+    def test_non_integer_keys_rejected(self):
+        """Test that keys which are not integers are rejected, also with a custom hash."""
+        for probe_type in ['linear', 'robin_hood']:
+            for hash_func in [None, lambda k, s: hash(k) % s]:
+                ht = HashTableOpenAddressing(8, hash_func=hash_func, probe_type=probe_type)
+                for operation in (lambda: ht.insert("apple", 1), lambda: ht.search("apple"),
+                                  lambda: ht.delete(1.5), lambda: ht.search_many(["apple"])):
+                    with pytest.raises(TypeError, match="integers"):
+                        operation()
+                
+                ht.insert(np.int64(3), "value3")  # NumPy integers are converted
+                assert ht.search(3) == "value3"
+                assert ht.search_many(np.array([3, 4], dtype=np.int32)) == ["value3", None]
+                assert ht.count == 1
+    
     def test_update_existing_key(self):
         """Test updating an existing key."""
         ht = HashTableOpenAddressing(10, probe_type='linear')
@@ -94,6 +300,27 @@ class TestHashTableOpenAddressing:
         ht.insert(10, "value2")  # Update
         assert ht.search(10) == "value2"
     
+    def test_size_rounded_to_power_of_two(self):
+        """Test that the table size is rounded up to a power of two."""
+        ht = HashTableOpenAddressing(10)
+        assert ht.size == 16
+        assert ht.mask == 15
+        ht.reserve(100)
+        assert ht.size & ht.mask == 0
+    
+    def test_full_table_probe_sequences(self):
+        """Test that every probe sequence reaches the last free slot of a full table."""
+        # All keys share home slot 0
+        keys = [8 * i for i in range(8)]
+        for probe_type in ['linear', 'quadratic', 'double']:
+            ht = HashTableOpenAddressing(8, probe_type=probe_type, load_factor_threshold=1.0)
+            for key in keys:
+                ht.insert(key, f"value{key}")
+            
+            assert ht.size == 8
+            for key in keys:
+                assert ht.search(key) == f"value{key}"
+    
     def test_resize(self):
         """Test automatic resizing."""
         ht = HashTableOpenAddressing(5, probe_type='linear', load_factor_threshold=0.7)
@@ -104,6 +331,84 @@ class TestHashTableOpenAddressing:
         # All should still be searchable
         for i in range(10):
             assert ht.search(i) == f"value{i}"
+    
+    def test_resize_places_entries_without_kernel(self):
+        """Test that rehashing follows each probe sequence inline, to the slot a search expects."""
+        keys = [(i * 7919) % 100003 for i in range(200)]
+        for probe_type in ['linear', 'quadratic', 'double']:
+            ht = HashTableOpenAddressing(256, probe_type=probe_type, load_factor_threshold=1.0)
+            ht.insert_many(keys)
+            kernel, calls = ht._probe_impl, []
+            ht._probe_impl = lambda *args: calls.append(args) or kernel(*args)
+            ht._resize(64 * 256)
+            ht._resize(256)  # Back to a crowded table with long probe sequences
+            assert calls == []
+            
+            ht._probe_impl = kernel
+            assert ht.search_many(keys) == keys
+            assert [ht.search(key) for key in keys] == keys
+            assert ht.count == len(keys)
+    
+    def test_reserve(self):
+        """Test that a reserved table holds n elements without resizing."""
+        ht = HashTableOpenAddressing(5, probe_type='linear', load_factor_threshold=0.7)
+        ht.insert(1, "value1")
+        ht.reserve(100)
+        reserved_size = ht.size
+        assert ht.search(1) == "value1"
+        
+        for i in range(100):
+            ht.insert(i, f"value{i}")
+        assert ht.size == reserved_size
+        assert ht.search(99) == "value99"
+    
+    def test_invalid_load_factor_threshold(self):
+        """Test that thresholds outside (0, 1] are rejected, so reserve always terminates."""
+        for threshold in [0, -0.5, 1.5, float('nan')]:
+            with pytest.raises(ValueError):
+                HashTableOpenAddressing(8, load_factor_threshold=threshold)
+        with pytest.raises(ValueError):
+            HashTableSeparateChaining(8, load_factor_threshold=0)
+        
+        ht = HashTableSeparateChaining(8, load_factor_threshold=2.0)
+        ht.reserve(100)
+        assert ht.size == 64
+    
+    def test_search_many_matches_search(self):
+        """Test that batched search returns the same values and counts as per-key search."""
+        keys = [(k * 7919) % 1000 for k in range(200)]
+        queries = keys + [k + 1000 for k in keys[:50]]
+        for probe_type in ['linear', 'quadratic', 'double', 'robin_hood']:
+            for hash_func in [None, lambda k, s: (k * 31) % s]:
+                ht = HashTableOpenAddressing(256, hash_func=hash_func, probe_type=probe_type,
+                                             load_factor_threshold=0.9)
+                ht.insert_many(keys, [f"value{k}" for k in keys])
+                for key in keys[::3]:
+                    ht.delete(key)
+                
+                ht.reset_counts()
+                expected = [ht.search(key) for key in queries]
+                counts = (ht.get_probe_count(), ht.get_comparison_count())
+                ht.reset_counts()
+                assert ht.search_many(np.array(queries)) == expected
+                assert (ht.get_probe_count(), ht.get_comparison_count()) == counts
+    
+    def test_resize_keeps_entries_and_counts(self):
+        """Test that a resize rehashes every entry without adding to the counters."""
+        for probe_type in ['linear', 'quadratic', 'double', 'robin_hood']:
+            ht = HashTableOpenAddressing(8, probe_type=probe_type)
+            keys = [8 * i + 3 for i in range(5)]
+            ht.insert_many(keys)
+            ht.delete(keys[0])
+            ht.reset_counts()
+            ht.reserve(64)
+            
+            assert ht.size == 128
+            assert ht.count == 4
+            assert ht.get_probe_count() == 0
+            assert ht.get_comparison_count() == 0
+            assert ht.DELETED_TAG not in ht.tags
+            assert ht.search_many(keys) == [None] + keys[1:]
 
 
 class TestHashTableSeparateChaining:
@@ -150,6 +455,21 @@ class TestHashTableSeparateChaining:
         for key in keys:
             assert ht.search(key) == f"value{key}"
     
+    def test_string_keys_in_one_chain(self):
+        """Test string keys sharing a bucket."""
+        ht = HashTableSeparateChaining(5, hash_func=lambda k, s: 0)
+        keys = ["apple", "banana", "cherry", "date"]
+        for key in keys:
+            ht.insert(key, key.upper())
+        ht.insert("banana", "updated")
+        
+        assert ht.search("apple") == "APPLE"
+        assert ht.search("banana") == "updated"
+        assert ht.search("fig") is None
+        assert ht.delete("cherry") is True
+        assert ht.search("cherry") is None
+        assert ht.search("date") == "DATE"
+    
     def test_chain_lengths(self):
         """Test chain length reporting."""
         ht = HashTableSeparateChaining(5)
@@ -172,6 +492,44 @@ class TestHashTableSeparateChaining:
         # All should still be searchable
         for i in range(20):
             assert ht.search(i) == f"value{i}"
+    
+    def test_reserve(self):
+        """Test that a reserved table holds n elements without resizing."""
+        ht = HashTableSeparateChaining(5, load_factor_threshold=1.0)
+        ht.insert(1, "value1")
+        ht.reserve(100)
+        reserved_size = ht.size
+        assert ht.search(1) == "value1"
+        
+        for i in range(100):
+            ht.insert(i, f"value{i}")
+        assert ht.size == reserved_size
+        assert ht.search(99) == "value99"
+    
+    def test_chains_are_parallel_lists(self):
+        """Test that each chain holds its keys and values in parallel lists."""
+        ht = HashTableSeparateChaining(4)
+        ht.insert_many([1, 5, 9, 2], ["a", "b", "c", "d"])
+        
+        assert ht.buckets[0] is None
+        assert ht.buckets[1] == ([1, 5, 9], ["a", "b", "c"])
+        assert ht.buckets[2] == ([2], ["d"])
+        
+        ht.delete(5)
+        assert ht.buckets[1] == ([1, 9], ["a", "c"])
+        ht.reserve(100)
+        assert ht.count == 3
+        assert ht.search_many([1, 5, 9, 2]) == ["a", None, "c", "d"]
+    
+    def test_comparison_counts(self):
+        """Test that a search counts one comparison per chain entry examined."""
+        ht = HashTableSeparateChaining(4)
+        ht.insert_many([1, 5, 9])
+        ht.reset_counts()
+        assert ht.search(9) == 9
+        assert ht.get_comparison_count() == 3
+        assert ht.search(13) is None
+        assert ht.get_comparison_count() == 6
 
 
 class TestHashTableComparison:
@@ -200,4 +558,59 @@ class TestHashTableComparison:
             assert ht_sc.delete(key) is True
             assert ht_oa.search(key) is None
             assert ht_sc.search(key) is None
-
+    
+    def test_bulk_insert_and_search(self):
+        """Test insert_many/search_many against single-key operations."""
+        keys = [10, 22, 31, 4, 15, 28, 17, 88, 59]
+        values = [f"value{key}" for key in keys]
+        
+        for ht in (HashTableOpenAddressing(5, probe_type='linear'),
+                   HashTableOpenAddressing(5, probe_type='robin_hood'),
+                   HashTableSeparateChaining(5)):
+            ht.insert_many(keys, values)
+            assert ht.search_many(keys + [99]) == values + [None]
+            
+            ht.insert_many([99])  # Values default to the keys
+            assert ht.search(99) == 99
+    
+    def test_stats_disabled(self):
+        """Test that tables without stats give the same results and leave the counts at 0."""
+        keys = list(range(0, 400, 7))
+        for probe_type in ['linear', 'quadratic', 'double', 'robin_hood']:
+            ht = HashTableOpenAddressing(8, probe_type=probe_type, stats=False)
+            ht.insert_many(keys)
+            assert ht.search_many(keys + [1]) == keys + [None]
+            assert [ht.search(key) for key in keys[:5]] == keys[:5]
+            assert ht.get_probe_count() == 0
+            assert ht.get_comparison_count() == 0
+        
+        ht = HashTableSeparateChaining(4, stats=False)
+        ht.insert_many(keys)
+        assert ht.search_many(keys + [1]) == keys + [None]
+        assert ht.get_comparison_count() == 0
+    
+    def test_resize_points(self):
+        """Test that a new key resizes exactly when count / size reaches the threshold."""
+        tables = [lambda size, threshold: HashTableSeparateChaining(size, load_factor_threshold=threshold)]
+        tables += [
+            lambda size, threshold, probe_type=probe_type: HashTableOpenAddressing(
+                size, probe_type=probe_type, load_factor_threshold=threshold)
+            for probe_type in ['linear', 'robin_hood']
+        ]
+        for make_table in tables:
+            for size in range(1, 33):
+                for threshold in [percent / 100 for percent in range(5, 101)]:
+                    ht = make_table(size, threshold)
+                    initial_size = ht.size
+                    for key in range(initial_size + 1):
+                        expected = ht.count / initial_size >= threshold
+                        ht.insert(key, key)
+                        assert (ht.size != initial_size) == expected
+                        if expected:
+                            break
+        
+        ht = HashTableSeparateChaining(25, load_factor_threshold=0.28)
+        ht.insert_many(range(7))
+        assert ht.size == 25
+        ht.insert(7, 7)
+        assert ht.size == 50